@@ -0,0 +1,130 @@
+// Long-lived AppleScript worker for mindm (osascript -l JavaScript worker.js).
+//
+// Reads framed JSON requests from stdin and writes framed JSON responses to
+// stdout. A frame is the decimal byte length of the body, a newline and the
+// UTF-8 encoded body.
+//
+// Requests:  {"script": "<AppleScript source>"}
+//            {"path": "<compiled script>", "args": ["<arg>", ...]}
+// Responses: {"result": "<text>"} or {"error": "<message>"}
+//
+// Compiled scripts are loaded once and kept for the lifetime of the worker.
+
+ObjC.import("Foundation");
+
+var stdin = $.NSFileHandle.fileHandleWithStandardInput;
+var stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+var compiledScripts = {};
+
+function fourCharCode(code) {
+    return ((code.charCodeAt(0) << 24) | (code.charCodeAt(1) << 16) | (code.charCodeAt(2) << 8) | code.charCodeAt(3)) >>> 0;
+}
+
+function dataToString(data) {
+    return $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+}
+
+function readHeader() {
+    var header = "";
+    while (true) {
+        var data = stdin.readDataOfLength(1);
+        if (data.length == 0) {
+            return null;
+        }
+        var ch = dataToString(data);
+        if (ch === "\n") {
+            return header;
+        }
+        header += ch;
+    }
+}
+
+function readFrame() {
+    var header = readHeader();
+    if (header === null) {
+        return null;
+    }
+    var length = parseInt(header, 10);
+    var data = stdin.readDataOfLength(length);
+    return JSON.parse(dataToString(data));
+}
+
+function writeFrame(response) {
+    var body = $(JSON.stringify(response)).dataUsingEncoding($.NSUTF8StringEncoding);
+    stdout.writeData($(body.length + "\n").dataUsingEncoding($.NSUTF8StringEncoding));
+    stdout.writeData(body);
+}
+
+function errorMessage(error) {
+    var info = error[0];
+    if (!info || info.isNil()) {
+        return "Unknown AppleScript error";
+    }
+    var message = info.objectForKey("NSAppleScriptErrorMessage");
+    return (!message || message.isNil()) ? "Unknown AppleScript error" : message.js;
+}
+
+function resultText(descriptor) {
+    var value = descriptor.stringValue;
+    return (!value || value.isNil()) ? "" : value.js;
+}
+
+function runSource(source) {
+    var error = Ref();
+    var script = $.NSAppleScript.alloc.initWithSource(source);
+    var result = script.executeAndReturnError(error);
+    if (result.isNil()) {
+        throw new Error(errorMessage(error));
+    }
+    return resultText(result);
+}
+
+function loadCompiled(path) {
+    if (!(path in compiledScripts)) {
+        var error = Ref();
+        var script = $.NSAppleScript.alloc.initWithContentsOfURLError($.NSURL.fileURLWithPath(path), error);
+        if (script.isNil()) {
+            throw new Error(errorMessage(error));
+        }
+        compiledScripts[path] = script;
+    }
+    return compiledScripts[path];
+}
+
+function runCompiled(path, args) {
+    var script = loadCompiled(path);
+    // same "run" event osascript sends, so the script's "on run argv" handler is used
+    var argv = $.NSAppleEventDescriptor.listDescriptor;
+    for (var i = 0; i < args.length; i++) {
+        argv.insertDescriptorAtIndex($.NSAppleEventDescriptor.descriptorWithString(args[i]), i + 1);
+    }
+    var event = $.NSAppleEventDescriptor.appleEventWithEventClassEventIDTargetDescriptorReturnIDTransactionID(
+        fourCharCode("aevt"), fourCharCode("oapp"), $.NSAppleEventDescriptor.nullDescriptor, -1, 0);
+    event.setParamDescriptorForKeyword(argv, fourCharCode("----"));
+    var error = Ref();
+    var result = script.executeAppleEventError(event, error);
+    if (result.isNil()) {
+        throw new Error(errorMessage(error));
+    }
+    return resultText(result);
+}
+
+function run(argv) {
+    while (true) {
+        var request = readFrame();
+        if (request === null) {
+            break;
+        }
+        var response;
+        try {
+            if (request.path) {
+                response = { result: runCompiled(request.path, request.args || []) };
+            } else {
+                response = { result: runSource(request.script) };
+            }
+        } catch (e) {
+            response = { error: String(e.message || e) };
+        }
+        writeFrame(response);
+    }
+}
@@ -9,14 +9,22 @@ appropriate platform-specific implementation.
 import sys
 
 class Mindmanager():
-    def __init__(self, charttype='auto', macos_access='appscript'):
+    def __init__(self, charttype='auto', macos_access='appscript', mmap_path=None):
         """
         Initialize a Mindmanager instance and delegate to the platform-specific implementation.
 
         Args:
             charttype (any): The type of chart to initialize with.
             macos_access (str): Method for accessing macOS features (default is 'appscript', alternative is 'applescript').
+            mmap_path (str, optional): Path to a .mmap file. If given, the file is accessed directly
+                and no MindManager instance is required.
         """
+        if mmap_path is not None:
+            import mindm.mindmanager_mmap as mm
+            self.platform = "mmap"
+            self.mindm = mm.Mindmanager(charttype, mmap_path)
+            return
+
         if sys.platform.startswith('win'):
             import mindm.mindmanager_win as mm
             self.platform = "win"
@@ -122,6 +130,18 @@ class Mindmanager():
         """
         return self.mindm.get_mindmaptopic_from_topic_full(topic)
 
+    def get_mindmaptopics_from_document(self, mode: str = 'full') -> list:
+        """
+        Retrieve all topics of the document in a single pass (Windows only).
+
+        Args:
+            mode (str): The mode to use to gather attributes (full=all attributes, content=text+rtf+notes, text=text only).
+
+        Returns:
+            list: (mindmap topic, parent GUID) tuples in document order.
+        """
+        return self.mindm.get_mindmaptopics_from_document(mode)
+
     def get_topic_by_id(self, id: any) -> any:
         """
         Retrieve a topic by its identifier.
@@ -134,6 +154,43 @@ class Mindmanager():
         """
         return self.mindm.get_topic_by_id(id)
 
+    def get_mindmaptopics(self, topic_ids: list, mode: str = 'full') -> list:
+        """
+        Retrieve the topic properties of many topics in batches (macOS AppleScript only).
+
+        Args:
+            topic_ids (list): The identifiers of the topics.
+            mode (str): The mode to use to gather attributes (full=all attributes, content=text+notes, text=text only).
+
+        Returns:
+            list: The mindmap topics in the order of the identifiers.
+        """
+        return self.mindm.get_mindmaptopics(topic_ids, mode)
+
+    def get_parents_from_topics(self, topic_ids: list) -> dict:
+        """
+        Retrieve the parent identifiers of many topics in batches (macOS AppleScript only).
+
+        Args:
+            topic_ids (list): The identifiers of the topics.
+
+        Returns:
+            dict: Mapping of topic identifier to parent identifier ("" for the central topic).
+        """
+        return self.mindm.get_parents_from_topics(topic_ids)
+
+    def get_subtree_from_topic(self, topic_id: str) -> any:
+        """
+        Retrieve the subtree starting at the given topic in a single call (macOS AppleScript only).
+
+        Args:
+            topic_id (str): The identifier of the start topic.
+
+        Returns:
+            any: The mindmap topic including its subtopics.
+        """
+        return self.mindm.get_subtree_from_topic(topic_id)
+
     def get_selection(self) -> list:
         """
         Get the currently selected topics.
@@ -10,7 +10,9 @@ properties, relationships, and document structure.
 import os
 import sys
 import json
+import atexit
 import subprocess
+import threading
 
 from mindmap.mindmap import (
     MindmapLink,
@@ -26,9 +28,128 @@ import mindmap.serialization as mms
 APPLESCRIPT_READ = os.path.join(os.path.dirname(__file__), "as", "read.scpt")
 APPLESCRIPT_WRITE = os.path.join(os.path.dirname(__file__), "as", "write.scpt")
 
+APPLESCRIPT_WORKER = os.path.join(os.path.dirname(__file__), "as", "worker.js")
+
+USE_APPLESCRIPT_WORKER = True
+
+
+def write_frame(stream, payload: dict) -> None:
+    """
+    Write a length-prefixed JSON frame (decimal byte length, newline, UTF-8 body).
+    """
+    body = json.dumps(payload).encode("utf-8")
+    stream.write(str(len(body)).encode("ascii") + b"\n" + body)
+    stream.flush()
+
+def read_frame(stream) -> dict:
+    """
+    Read a length-prefixed JSON frame. Returns None at end of stream.
+    """
+    header = stream.readline()
+    if not header:
+        return None
+    length = int(header.strip())
+    body = stream.read(length)
+    if len(body) < length:
+        raise EOFError("Incomplete frame from AppleScript worker.")
+    return json.loads(body.decode("utf-8"))
+
+
+class AppleScriptWorker:
+    """
+    Long-lived osascript process executing AppleScript requests.
+
+    Spawning osascript and loading a script costs about 100 ms per call. The
+    worker is started once, keeps compiled scripts loaded and answers framed
+    requests over stdin/stdout (see write_frame/read_frame and as/worker.js).
+    """
+
+    def __init__(self, command: list = None):
+        self.command = command or ["osascript", "-l", "JavaScript", APPLESCRIPT_WORKER]
+        self._process = None
+        self._lock = threading.Lock()
+
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        self._process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def close(self):
+        if self._process is not None:
+            try:
+                self._process.stdin.close()
+                self._process.wait(timeout=5)
+            except Exception:
+                self._process.kill()
+            self._process = None
+
+    def request(self, payload: dict) -> dict:
+        """
+        Send a request and wait for its response. A worker that died in between
+        is restarted once.
+        """
+        with self._lock:
+            for attempt in range(2):
+                if not self.is_running():
+                    self.start()
+                try:
+                    write_frame(self._process.stdin, payload)
+                    response = read_frame(self._process.stdout)
+                    if response is None:
+                        raise EOFError("AppleScript worker closed the connection.")
+                    return response
+                except (OSError, ValueError, EOFError):
+                    self.close()
+                    if attempt == 1:
+                        raise
+
+    def run_script(self, script: str) -> str:
+        return self._result(self.request({"script": script}))
+
+    def run_compiled_script(self, script_path: str, args: list = None) -> str:
+        return self._result(self.request({"path": script_path, "args": args or []}))
+
+    def _result(self, response: dict) -> str:
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return (response.get("result") or "").strip()
+
+
+_worker = None
+
+def _get_worker() -> AppleScriptWorker:
+    global _worker
+    if _worker is None and USE_APPLESCRIPT_WORKER:
+        _worker = AppleScriptWorker()
+        atexit.register(_worker.close)
+    return _worker
+
+def _disable_worker(e: Exception):
+    global USE_APPLESCRIPT_WORKER, _worker
+    print(f"AppleScript worker unavailable, falling back to osascript per call: {e}")
+    USE_APPLESCRIPT_WORKER = False
+    if _worker is not None:
+        _worker.close()
+        _worker = None
+
 def _run_applescript(script: str, args: list = None) -> str:
     if args is None:
         args = []
+
+    worker = _get_worker() if not args else None
+    if worker is not None:
+        try:
+            return worker.run_script(script)
+        except RuntimeError as e:
+            print(f"AppleScript error: {e}")
+            return ""
+        except (OSError, ValueError, EOFError) as e:
+            _disable_worker(e)
     
     command = ["osascript", "-e", script] + args
     try:
@@ -46,6 +167,16 @@ def _run_applescript(script: str, args: list = None) -> str:
 def _run_compiled_applescript(script_path: str, args: list = None) -> str:
     if args is None:
         args = []
+
+    worker = _get_worker()
+    if worker is not None:
+        try:
+            return worker.run_compiled_script(script_path, args)
+        except RuntimeError as e:
+            print(f"AppleScript error: {e}")
+            return ""
+        except (OSError, ValueError, EOFError) as e:
+            _disable_worker(e)
     
     command = ["osascript", script_path] + (args or [])
     
@@ -66,6 +197,7 @@ def _run_compiled_applescript(script_path: str, args: list = None) -> str:
 class Mindmanager:
 
     MACOS_MERGE_ALL_WINDOWS = False
+    LIST_PROPERTIES_CHUNK_SIZE = 100
     MACOS_LIBRARY_FOLDER = os.path.join(
         os.path.expanduser("~"), 
         "Library", 
@@ -226,6 +358,13 @@ class Mindmanager:
         result = self._read("getTree")
         return result[0] if result else None
 
+    def get_subtree_from_topic(self, topic_id) -> 'MindmapTopic':
+        """
+        Return the subtree starting at the given topic with a single AppleScript call.
+        """
+        result = self._read("getTree", [topic_id])
+        return result[0] if result else None
+
     def get_mindmaptopic_from_topic(self, topic) -> 'MindmapTopic':
         """
         Returns a MindmapTopic with guid, text, rtf and level,
@@ -427,6 +566,61 @@ class Mindmanager:
             references=references,
         )
     
+    def get_mindmaptopics(self, topic_ids: list, mode='full') -> list['MindmapTopic']:
+        """
+        Returns MindmapTopics for a list of topic IDs with one getListProperties call
+        per chunk of LIST_PROPERTIES_CHUNK_SIZE IDs, in the order of the IDs.
+        Topics which could not be read are skipped.
+        """
+        topic_ids = [topic_id for topic_id in topic_ids if topic_id]
+        topics = []
+        for start in range(0, len(topic_ids), self.LIST_PROPERTIES_CHUNK_SIZE):
+            chunk = topic_ids[start:start + self.LIST_PROPERTIES_CHUNK_SIZE]
+            result = self._read("getListProperties", chunk) or []
+            for topic in result:
+                if not topic.guid:
+                    continue
+                if mode != 'full':
+                    topic.references = []
+                if mode == 'text':
+                    topic.notes = None
+                topics.append(topic)
+        return topics
+
+    def get_parents_from_topics(self, topic_ids: list) -> dict:
+        """
+        Returns a dict mapping each topic ID to the ID of its parent topic
+        ("" for the central topic), with one AppleScript call per chunk.
+        """
+        topic_ids = [topic_id for topic_id in topic_ids if topic_id]
+        parents = {}
+        for start in range(0, len(topic_ids), self.LIST_PROPERTIES_CHUNK_SIZE):
+            chunk = topic_ids[start:start + self.LIST_PROPERTIES_CHUNK_SIZE]
+            id_list = ", ".join('"' + topic_id.replace('"', '\\"') + '"' for topic_id in chunk)
+            script = f'''
+                tell application "MindManager"
+                    set output to ""
+                    repeat with topicID in {{{id_list}}}
+                        try
+                            set theTopic to first topic of document 1 whose id is (contents of topicID)
+                            set p to parent of theTopic
+                            if p is not missing value then
+                                set output to output & (contents of topicID) & "||" & (id of p) & linefeed
+                            else
+                                set output to output & (contents of topicID) & "||" & linefeed
+                            end if
+                        end try
+                    end repeat
+                    return output
+                end tell
+            '''
+            raw = _run_applescript(script)
+            for line in raw.splitlines():
+                parts = line.strip().split("||")
+                if len(parts) == 2 and parts[0]:
+                    parents[parts[0]] = parts[1]
+        return parents
+
     def get_topic_by_id(self, topic_id):
         return topic_id
 
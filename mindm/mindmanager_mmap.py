@@ -0,0 +1,936 @@
+"""
+File-based implementation of the Mindmanager interface.
+
+This module reads MindManager ``.mmap`` archives directly, without a running
+MindManager instance. A ``.mmap`` file is a zip archive holding the map as
+``Document.xml`` plus binary resources (images, custom icons). The document is
+parsed once into a tree of MindmapTopic objects which then serve as topic
+handles for the platform-independent interface, so every topic access is an
+in-memory operation instead of a COM or AppleScript round-trip.
+
+Maps created through the same interface are kept in memory as well and are
+written to a new archive by ``finalize``.
+
+For very large maps ``iter_mmap_topics`` streams the topics depth-first
+without building the tree; combined with the line generators in
+``mindmap.serialization`` an export can be written while the file is parsed.
+"""
+
+import base64
+import hashlib
+import io
+import os
+import pickle
+import re
+import struct
+import tempfile
+import uuid
+import zipfile
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape, quoteattr
+
+from mindmap.mindmap import MindmapLink, MindmapImage, MindmapNotes, MindmapIcon, MindmapTag, MindmapReference, MindmapTopic
+
+DOCUMENT_XML = "Document.xml"
+
+NS_AP = "http://schemas.mindjet.com/MindManager/Application/2003"
+NS_COR = "http://schemas.mindjet.com/MindManager/Core/2003"
+NS_XSI = "http://www.w3.org/2001/XMLSchema-instance"
+NS_XHTML = "http://www.w3.org/1999/xhtml"
+
+NS = {"ap": NS_AP, "cor": NS_COR}
+
+TAG_TOPIC = f"{{{NS_AP}}}Topic"
+TAG_SUBTOPICS = f"{{{NS_AP}}}SubTopics"
+TAG_ONE_TOPIC = f"{{{NS_AP}}}OneTopic"
+TAG_RELATIONSHIP = f"{{{NS_AP}}}Relationship"
+TAG_MARKERS_SET_GROUP = f"{{{NS_AP}}}MarkersSetGroup"
+TAG_STYLE_GROUP = f"{{{NS_AP}}}StyleGroup"
+TAG_SELECTION = f"{{{NS_AP}}}Selection"
+ATTR_XSI_TYPE = f"{{{NS_XSI}}}type"
+
+STOCK_ICON_PREFIX = "urn:mindjet:"
+ARCHIVE_URI_PREFIX = "mmarch://"
+TOPIC_LINK_PATTERN = re.compile(r"@OId='([^']+)'")
+
+DEFAULT_TOPIC_TEXTS = {0: "Central Topic", 1: "Main Topic"}
+DEFAULT_SUBTOPIC_TEXT = "Subtopic"
+
+
+def oid_to_guid(oid: str) -> str:
+    """Convert a base64 encoded OId attribute into the GUID notation used by MindManager."""
+    try:
+        return str(uuid.UUID(bytes=base64.b64decode(oid))).upper()
+    except (ValueError, TypeError):
+        return oid
+
+
+def guid_to_oid(guid: str) -> str:
+    """Convert a GUID into the base64 encoded OId notation used in Document.xml."""
+    try:
+        return base64.b64encode(uuid.UUID(guid).bytes).decode("ascii")
+    except (ValueError, TypeError, AttributeError):
+        return guid
+
+
+class MmapParser:
+    """
+    Incremental parser for the ``Document.xml`` part of a ``.mmap`` archive.
+
+    Elements are dropped as soon as they are consumed, so the peak memory is
+    dominated by the resulting MindmapTopic tree and not by the XML DOM.
+    """
+
+    def __init__(self, archive: zipfile.ZipFile, mode: str = 'full'):
+        self.archive = archive
+        self.mode = mode
+        self.version = ""
+        self.root = None
+        self.topics = {}
+        self.selection = []
+        self.relationships = []
+        self.icon_markers = {}
+        self.default_texts = {}
+        self._missing_text = []
+        self._custom_icons = []
+
+    def parse(self) -> 'MindmapTopic':
+        stack = []
+        elements = []
+        with self.archive.open(DOCUMENT_XML) as source:
+            for event, elem in ET.iterparse(source, events=("start", "end", "pi")):
+                if event == "pi":
+                    self._read_processing_instruction(elem.text or "")
+                    continue
+                if event == "start":
+                    if elem.tag == TAG_TOPIC:
+                        container = elements[-1].tag if elements else None
+                        if container in (TAG_SUBTOPICS, TAG_ONE_TOPIC) and (not stack or stack[-1] is not None):
+                            stack.append(self._start_topic(elem, stack[-1] if stack else None, len(stack)))
+                        else:
+                            # floating topics, callouts etc. are not part of the topic tree
+                            stack.append(None)
+                    elements.append(elem)
+                    continue
+
+                elements.pop()
+                if elem.tag == TAG_TOPIC:
+                    topic = stack.pop()
+                    if topic is not None:
+                        self._end_topic(elem, topic)
+                elif elem.tag == TAG_RELATIONSHIP:
+                    self._read_relationship(elem)
+                elif elem.tag == TAG_MARKERS_SET_GROUP:
+                    self._read_markers(elem)
+                elif elem.tag == TAG_STYLE_GROUP:
+                    self._read_default_texts(elem)
+                elif elem.tag == TAG_SELECTION:
+                    self._read_selection(elem)
+                else:
+                    continue
+                # detach consumed elements so that finished siblings do not pile up
+                elem.clear()
+                if elements:
+                    elements[-1].remove(elem)
+        self._finish()
+        return self.root
+
+    def _read_processing_instruction(self, text):
+        if text.startswith("xml-client"):
+            match = re.search(r'version="(\d+)', text)
+            if match:
+                self.version = match.group(1)
+
+    def _start_topic(self, elem, parent, level) -> 'MindmapTopic':
+        topic = MindmapTopic(guid=oid_to_guid(elem.get("OId", "")), level=level, parent=parent)
+        if parent is None:
+            self.root = topic
+        else:
+            parent.subtopics.append(topic)
+        self.topics[topic.guid] = topic
+        return topic
+
+    def _end_topic(self, elem, topic):
+        read_topic_properties(elem, topic, self.mode)
+        if elem.find("ap:Text", NS) is None:
+            self._missing_text.append(topic)
+        for icon in topic.icons:
+            if not icon.is_stock_icon:
+                self._custom_icons.append(icon)
+
+    def _read_relationship(self, elem):
+        guids = {}
+        for group in elem.findall("ap:ConnectionGroup", NS):
+            ref = group.find("ap:Connection/ap:ObjectReference", NS)
+            if ref is not None:
+                guids[group.get("Index")] = oid_to_guid(ref.get("OIdRef", ""))
+        if "0" in guids and "1" in guids:
+            self.relationships.append((guids["0"], guids["1"]))
+
+    def _read_markers(self, elem):
+        for marker_set in elem.findall("ap:IconMarkersSets/ap:IconMarkersSet", NS):
+            name = marker_set.find("ap:Name", NS)
+            group = name.get("Name", "") if name is not None else ""
+            for marker in marker_set.findall("ap:IconMarkers/ap:IconMarker", NS):
+                custom_icon = marker.find("ap:OneCustomIcon", NS)
+                if custom_icon is None:
+                    continue
+                marker_name = marker.find("ap:Name", NS)
+                self.icon_markers[custom_icon.get("IconSignature", "")] = (
+                    marker_name.get("Name", "") if marker_name is not None else "",
+                    group,
+                )
+
+    def _read_default_texts(self, elem):
+        root_defaults = elem.find("ap:RootTopicDefaultsGroup/ap:DefaultText", NS)
+        if root_defaults is not None:
+            self.default_texts[0] = root_defaults.get("PlainText", "")
+        for group in elem.findall("ap:RootSubTopicDefaultsGroup", NS):
+            default_text = group.find("ap:DefaultText", NS)
+            try:
+                level = int(group.get("Level", "")) + 1
+            except ValueError:
+                continue
+            if default_text is not None:
+                self.default_texts[level] = default_text.get("PlainText", "")
+
+    def _read_selection(self, elem):
+        for ref in elem.findall("ap:ObjectReference", NS):
+            self.selection.append(oid_to_guid(ref.get("OIdRef", "")))
+
+    def _finish(self):
+        for topic in self._missing_text:
+            topic.text = default_topic_text(topic.level, self.default_texts)
+        for guid_1, guid_2 in self.relationships:
+            if guid_1 in self.topics:
+                self.topics[guid_1].references.append(MindmapReference(guid_1=guid_1, guid_2=guid_2, direction=1))
+            if guid_2 in self.topics:
+                self.topics[guid_2].references.append(MindmapReference(guid_1=guid_1, guid_2=guid_2, direction=2))
+        for icon in self._custom_icons:
+            if icon.signature in self.icon_markers:
+                icon.text, icon.group = self.icon_markers[icon.signature]
+
+
+class MmapStreamParser(MmapParser):
+    """
+    Variant of MmapParser that keeps only the current topic path in memory.
+
+    In ``Document.xml`` the text, notes and icons of a topic follow its
+    subtopics, so a topic is complete only after its whole subtree has been
+    read. Finished topics are therefore pickled into a temporary spool file
+    and a fixed size index entry is written at their pre-order position.
+    Reading the index sequentially afterwards yields the topics depth-first
+    in document order while the memory stays bounded by the tree depth.
+    """
+
+    INDEX_RECORD = struct.Struct("<QQ?")
+
+    def __init__(self, archive: zipfile.ZipFile, mode: str = 'full'):
+        super().__init__(archive, mode)
+        self.count = 0
+        self._data = tempfile.TemporaryFile()
+        self._index = tempfile.TemporaryFile()
+
+    def _start_topic(self, elem, parent, level):
+        topic = MindmapTopic(guid=oid_to_guid(elem.get("OId", "")), level=level)
+        self.count += 1
+        return (self.count - 1, topic)
+
+    def _end_topic(self, elem, entry):
+        index, topic = entry
+        read_topic_properties(elem, topic, self.mode)
+        data = pickle.dumps(topic, pickle.HIGHEST_PROTOCOL)
+        offset = self._data.seek(0, os.SEEK_END)
+        self._data.write(data)
+        self._index.seek(index * self.INDEX_RECORD.size)
+        self._index.write(self.INDEX_RECORD.pack(offset, len(data), elem.find("ap:Text", NS) is not None))
+
+    def _finish(self):
+        pass
+
+    def iter_topics(self):
+        """
+        Yield the spooled topics depth-first in document order.
+
+        Yields:
+            tuple[int, MindmapTopic]: The level and the topic. Subtopics are not attached,
+                the parent refers to the previously yielded ancestor.
+        """
+        references = {}
+        for guid_1, guid_2 in (self.relationships if self.mode == 'full' else []):
+            references.setdefault(guid_1, []).append(MindmapReference(guid_1=guid_1, guid_2=guid_2, direction=1))
+            references.setdefault(guid_2, []).append(MindmapReference(guid_1=guid_1, guid_2=guid_2, direction=2))
+        ancestors = []
+        for index in range(self.count):
+            self._index.seek(index * self.INDEX_RECORD.size)
+            offset, length, has_text = self.INDEX_RECORD.unpack(self._index.read(self.INDEX_RECORD.size))
+            self._data.seek(offset)
+            topic = pickle.loads(self._data.read(length))
+            if not has_text:
+                topic.text = default_topic_text(topic.level, self.default_texts)
+            if topic.guid in references:
+                topic.references = references[topic.guid]
+            for icon in topic.icons:
+                if not icon.is_stock_icon and icon.signature in self.icon_markers:
+                    icon.text, icon.group = self.icon_markers[icon.signature]
+            del ancestors[topic.level:]
+            topic.parent = ancestors[-1] if ancestors else None
+            ancestors.append(topic)
+            yield topic.level, topic
+
+    def close(self):
+        self._data.close()
+        self._index.close()
+
+
+def iter_mmap_topics(path: str, mode: str = 'full'):
+    """
+    Stream the topics of a .mmap file depth-first without building the topic tree.
+
+    Archive resources (images, custom icons) are not extracted; they keep their
+    ``mmarch://`` URIs.
+
+    Args:
+        path (str): Path to the .mmap file.
+        mode (str): full=all attributes, content=text+notes, text=text only.
+
+    Yields:
+        tuple[int, MindmapTopic]: The level and the topic.
+    """
+    if not os.path.isfile(path):
+        raise Exception(f"No document found: {path}")
+    with zipfile.ZipFile(path) as archive:
+        parser = MmapStreamParser(archive, mode)
+        try:
+            parser.parse()
+        except Exception:
+            parser.close()
+            raise
+    try:
+        yield from parser.iter_topics()
+    finally:
+        parser.close()
+
+
+def default_topic_text(level: int, default_texts: dict) -> str:
+    """Return the text MindManager displays for a topic without explicit text."""
+    if level in default_texts:
+        return default_texts[level]
+    if level in DEFAULT_TOPIC_TEXTS:
+        return DEFAULT_TOPIC_TEXTS[level]
+    return DEFAULT_SUBTOPIC_TEXT
+
+
+def read_topic_properties(elem, topic: 'MindmapTopic', mode: str = 'full') -> 'MindmapTopic':
+    """
+    Fill a MindmapTopic from the direct children of an ``ap:Topic`` element.
+
+    The mode selects the attributes to read (full=all attributes, content=text+notes, text=text only).
+
+    Archive resources (images, custom icons) are referenced by their
+    ``mmarch://`` URI; see Mindmanager.get_archive_file to extract them.
+    """
+    text = elem.find("ap:Text", NS)
+    if text is not None:
+        topic.text = text.get("PlainText", "").replace('"', '`').replace("'", "`").replace("\r", "").replace("\n", "")
+    if mode == 'text':
+        return topic
+
+    notes = elem.find("ap:NotesGroup/ap:NotesXhtmlData", NS)
+    if notes is not None:
+        topic.notes = MindmapNotes(text=notes.get("PreviewPlainText", ""), xhtml=_xhtml_to_string(notes))
+    if mode == 'content':
+        return topic
+
+    links = []
+    for hyperlink in elem.findall("ap:Hyperlink", NS):
+        url = hyperlink.get("Url", "")
+        match = TOPIC_LINK_PATTERN.search(url) if url.startswith("#") else None
+        if match:
+            links.append(MindmapLink(text=hyperlink.get("Title", ""), guid=oid_to_guid(match.group(1))))
+        else:
+            links.append(MindmapLink(text=hyperlink.get("Title", ""), url=url))
+    if links:
+        topic.links = links
+
+    image_uri = elem.find("ap:OneImage/ap:Image/ap:ImageData/cor:Uri", NS)
+    if image_uri is not None and image_uri.text:
+        topic.image = MindmapImage(text=image_uri.text.strip())
+
+    icons_group = elem.find("ap:IconsGroup", NS)
+    if icons_group is not None:
+        icon_uris = {}
+        for image_data in icons_group.findall("ap:CustomIconImageData", NS):
+            uri = image_data.find("cor:Uri", NS)
+            if uri is not None and uri.text:
+                icon_uris[image_data.get("IconSignature", "")] = uri.text.strip()
+        icons = []
+        for icon in icons_group.findall("ap:Icons/ap:Icon", NS):
+            if icon.get(ATTR_XSI_TYPE) == "ap:CustomIcon":
+                signature = icon.get("IconSignature", "")
+                icons.append(MindmapIcon(is_stock_icon=False, signature=signature, path=icon_uris.get(signature, "")))
+            else:
+                icon_type = icon.get("IconType", "")
+                if icon_type.startswith(STOCK_ICON_PREFIX):
+                    icon_type = icon_type[len(STOCK_ICON_PREFIX):]
+                icons.append(MindmapIcon(text=icon_type))
+        topic.icons = icons
+
+    text_labels = elem.findall("ap:TextLabels/ap:TextLabel", NS)
+    if text_labels:
+        topic.tags = [MindmapTag(text=label.get("TextLabelName", "")) for label in text_labels]
+
+    return topic
+
+
+def _xhtml_to_string(notes) -> str:
+    prefix = f"{{{NS_XHTML}}}"
+    for child in notes:
+        # the element is discarded after reading, so the namespace can be stripped in place
+        for elem in child.iter():
+            if isinstance(elem.tag, str) and elem.tag.startswith(prefix):
+                elem.tag = elem.tag[len(prefix):]
+        child.set("xmlns", NS_XHTML)
+        return ET.tostring(child, encoding="unicode")
+    return ""
+
+
+IMAGE_TYPES = {
+    ".png": "urn:mindjet:PngImage",
+    ".jpg": "urn:mindjet:JpegImage",
+    ".jpeg": "urn:mindjet:JpegImage",
+    ".gif": "urn:mindjet:GifImage",
+    ".bmp": "urn:mindjet:BmpImage",
+}
+WRITER_VERSION = "23.0.169"
+
+
+def icon_signature(path: str) -> str:
+    """Compute the IconSignature MindManager uses to identify a custom icon image."""
+    with open(path, "rb") as f:
+        return base64.b64encode(hashlib.md5(f.read()).digest()).decode("ascii")
+
+
+def _archive_name(folder: str, key: str, path: str) -> str:
+    name = str(uuid.UUID(bytes=hashlib.md5(key.encode("utf-8")).digest())).upper()
+    return f"{folder}/{name}{os.path.splitext(path)[1].lower() or '.bin'}"
+
+
+def _notes_xhtml(notes: 'MindmapNotes') -> str:
+    """Return the notes as a single ``html`` element in the XHTML namespace."""
+    if notes.xhtml:
+        xhtml = re.sub(r'<\?xml[^>]*\?>|<!DOCTYPE[^>]*>', '', notes.xhtml).strip()
+        try:
+            html = ET.fromstring(xhtml)
+        except ET.ParseError:
+            html = None
+        if html is not None:
+            for elem in html.iter():
+                if isinstance(elem.tag, str) and elem.tag.startswith("{"):
+                    elem.tag = elem.tag.split("}", 1)[1]
+            if html.tag != "html":
+                wrapper = ET.Element("html")
+                wrapper.append(html)
+                html = wrapper
+            html.set("xmlns", NS_XHTML)
+            return ET.tostring(html, encoding="unicode")
+    paragraphs = "".join(f"<p>{escape(line)}</p>" for line in (notes.text or "").splitlines())
+    return f'<html xmlns="{NS_XHTML}">{paragraphs}</html>'
+
+
+class MmapWriter:
+    """
+    Writer for ``.mmap`` archives.
+
+    The topic tree is written depth-first into ``Document.xml`` without
+    building a DOM; images and custom icon files referenced by the topics
+    are copied into the archive afterwards.
+    """
+
+    def __init__(self, root: 'MindmapTopic', relationships: list = None, icon_markers: dict = None, tags: list = None, collapse_level: int = None):
+        self.root = root
+        self.relationships = relationships or []
+        self.icon_markers = icon_markers or {}
+        self.tags = tags or []
+        self.collapse_level = collapse_level
+        self.resources = {}
+
+    def write(self, path: str):
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+            with archive.open(DOCUMENT_XML, "w") as raw, io.TextIOWrapper(raw, encoding="utf-8") as out:
+                self._write_document(out)
+            for name, source in self.resources.items():
+                archive.write(source, name)
+
+    def _write_document(self, out):
+        out.write('<?xml version="1.0" encoding="UTF-8" standalone="no"?>')
+        out.write(f'<?xml-client name="MindManager" version="{WRITER_VERSION}"?>')
+        out.write(
+            f'<ap:Map OId={quoteattr(guid_to_oid(str(uuid.uuid4())))} '
+            f'xmlns:ap="{NS_AP}" xmlns:cor="{NS_COR}" xmlns:xsi="{NS_XSI}">'
+        )
+        out.write("<ap:OneTopic>")
+        self._write_topics(out)
+        out.write("</ap:OneTopic>")
+        if self.relationships:
+            out.write("<ap:Relationships>")
+            for guid_1, guid_2 in self.relationships:
+                out.write(f'<ap:Relationship OId={quoteattr(guid_to_oid(str(uuid.uuid4())))}>')
+                for index, guid in enumerate((guid_1, guid_2)):
+                    out.write(
+                        f'<ap:ConnectionGroup Index="{index}"><ap:Connection>'
+                        f'<ap:ObjectReference OIdRef={quoteattr(guid_to_oid(guid))}/>'
+                        "</ap:Connection></ap:ConnectionGroup>"
+                    )
+                out.write("</ap:Relationship>")
+            out.write("</ap:Relationships>")
+        self._write_markers(out)
+        out.write("</ap:Map>")
+
+    def _write_topics(self, out):
+        # explicit stack instead of recursion, generated maps can be deeper than the recursion limit
+        stack = [("topic", self.root)]
+        while stack:
+            action, topic = stack.pop()
+            if action == "topic":
+                out.write(f"<ap:Topic OId={quoteattr(guid_to_oid(topic.guid))}>")
+                stack.append(("properties", topic))
+                if topic.subtopics:
+                    out.write("<ap:SubTopics>")
+                    stack.append(("subtopics", topic))
+                    stack.extend(("topic", sub) for sub in reversed(topic.subtopics))
+            elif action == "subtopics":
+                out.write("</ap:SubTopics>")
+            else:
+                self._write_topic_properties(out, topic)
+                out.write("</ap:Topic>")
+
+    def _write_topic_properties(self, out, topic):
+        if topic.image and topic.image.text and os.path.isfile(topic.image.text):
+            path = topic.image.text
+            name = _archive_name("bin", path, path)
+            self.resources[name] = path
+            image_type = IMAGE_TYPES.get(os.path.splitext(path)[1].lower(), IMAGE_TYPES[".png"])
+            out.write(
+                f'<ap:OneImage><ap:Image OId={quoteattr(guid_to_oid(str(uuid.uuid4())))}>'
+                f'<ap:ImageData ImageType="{image_type}"><cor:Uri xsi:nil="false">{ARCHIVE_URI_PREFIX}{name}</cor:Uri></ap:ImageData>'
+                "</ap:Image></ap:OneImage>"
+            )
+        collapsed = self.collapse_level is not None and topic.subtopics and topic.level > self.collapse_level
+        out.write(
+            '<ap:TopicViewGroup ViewIndex="0">'
+            f'<ap:Collapsed Collapsed="{"true" if collapsed else "false"}"/>'
+            "</ap:TopicViewGroup>"
+        )
+        out.write(f"<ap:Text PlainText={quoteattr(topic.text or '')} ReadOnly=\"false\"><ap:Font/></ap:Text>")
+        if topic.notes and (topic.notes.text or topic.notes.xhtml):
+            out.write(
+                f"<ap:NotesGroup><ap:NotesXhtmlData PreviewPlainText={quoteattr(topic.notes.text or '')}>"
+                f"{_notes_xhtml(topic.notes)}</ap:NotesXhtmlData></ap:NotesGroup>"
+            )
+        for link in topic.links:
+            if link.guid:
+                url = f"#xpointer(/descendant-or-self::ap:Topic[@OId='{guid_to_oid(link.guid)}'])"
+            elif link.url:
+                url = link.url
+            else:
+                continue
+            out.write(f"<ap:Hyperlink Url={quoteattr(url)} Title={quoteattr(link.text or '')}/>")
+        self._write_icons(out, topic.icons)
+        if topic.tags:
+            out.write("<ap:TextLabels>")
+            for tag in topic.tags:
+                out.write(f"<ap:TextLabel TextLabelName={quoteattr(tag.text)}/>")
+            out.write("</ap:TextLabels>")
+
+    def _write_icons(self, out, icons):
+        entries = []
+        image_data = {}
+        for icon in icons:
+            if icon.is_stock_icon:
+                if icon.text:
+                    entries.append(f'<ap:Icon xsi:type="ap:StockIcon" IconType="{STOCK_ICON_PREFIX}{escape(icon.text.replace(" ", ""))}"/>')
+                continue
+            signature = icon.signature
+            path = self.icon_markers[signature][2] if signature in self.icon_markers else icon.path
+            if not path or not os.path.isfile(path):
+                continue
+            if not signature:
+                signature = icon_signature(path)
+            name = _archive_name("ico", signature, path)
+            self.resources[name] = path
+            image_data[signature] = name
+            entries.append(f'<ap:Icon xsi:type="ap:CustomIcon" IconSignature={quoteattr(signature)}/>')
+        if not entries:
+            return
+        out.write("<ap:IconsGroup><ap:Icons>" + "".join(entries) + "</ap:Icons>")
+        for index, (signature, name) in enumerate(image_data.items()):
+            out.write(
+                f'<ap:CustomIconImageData Index="{index}" IconSignature={quoteattr(signature)} ImageType="urn:mindjet:IconImage">'
+                f'<cor:Uri xsi:nil="false">{ARCHIVE_URI_PREFIX}{name}</cor:Uri></ap:CustomIconImageData>'
+            )
+        out.write("</ap:IconsGroup>")
+
+    def _write_markers(self, out):
+        groups = {}
+        for signature, (name, group, path) in self.icon_markers.items():
+            if path and os.path.isfile(path):
+                groups.setdefault(group, []).append((signature, name, path))
+        if not groups and not self.tags:
+            return
+        out.write("<ap:MarkersSetGroup>")
+        if groups:
+            out.write("<ap:IconMarkersSets>")
+            for group, markers in groups.items():
+                out.write(f"<ap:IconMarkersSet OId={quoteattr(guid_to_oid(str(uuid.uuid4())))}><ap:Name Name={quoteattr(group)}/><ap:IconMarkers>")
+                for signature, name, path in markers:
+                    archive_name = _archive_name("ico", signature, path)
+                    self.resources[archive_name] = path
+                    out.write(
+                        f'<ap:IconMarker xsi:type="ap:CustomIconMarker" OId={quoteattr(guid_to_oid(str(uuid.uuid4())))}>'
+                        f"<ap:Name Name={quoteattr(name)}/><ap:OneCustomIcon IconSignature={quoteattr(signature)}/>"
+                        f'<ap:CustomIconImageData IconSignature={quoteattr(signature)} ImageType="urn:mindjet:IconImage">'
+                        f'<cor:Uri xsi:nil="false">{ARCHIVE_URI_PREFIX}{archive_name}</cor:Uri></ap:CustomIconImageData>'
+                        "</ap:IconMarker>"
+                    )
+                out.write("</ap:IconMarkers></ap:IconMarkersSet>")
+            out.write("</ap:IconMarkersSets>")
+        if self.tags:
+            out.write("<ap:TextLabelMarkers>")
+            for tag in self.tags:
+                out.write(f"<ap:TextLabelMarker OId={quoteattr(guid_to_oid(str(uuid.uuid4())))}><ap:Name Name={quoteattr(tag)}/></ap:TextLabelMarker>")
+            out.write("</ap:TextLabelMarkers>")
+        out.write("</ap:MarkersSetGroup>")
+
+
+class Mindmanager:
+
+    def __init__(self, charttype, path):
+        self._charttype = charttype
+        self._path = path
+        self._version = ""
+        self._central_topic = None
+        self._topics = {}
+        self._selection = []
+        self._extracted = {}
+        self._relationships = []
+        self._icon_markers = {}
+        self._tags = []
+        self._created = False
+
+    def _load(self):
+        if self._central_topic is None:
+            if not os.path.exists(self._path):
+                raise Exception(f"No document found: {self._path}")
+            with zipfile.ZipFile(self._path) as archive:
+                parser = MmapParser(archive)
+                parser.parse()
+            self._central_topic = parser.root
+            self._topics = parser.topics
+            self._selection = parser.selection
+            self._version = parser.version
+        return self._central_topic
+
+    def get_archive_file(self, uri):
+        """
+        Extract a ``mmarch://`` resource to a temporary file and return its path.
+        Paths that are not archive URIs are returned unchanged.
+        """
+        if not uri.startswith(ARCHIVE_URI_PREFIX):
+            return uri
+        if uri not in self._extracted:
+            name = uri[len(ARCHIVE_URI_PREFIX):]
+            suffix = os.path.splitext(name)[1]
+            if suffix == ".bin":
+                suffix = ".png"
+            try:
+                with zipfile.ZipFile(self._path) as archive:
+                    data = archive.read(name)
+                with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+                    tmp.write(data)
+                    self._extracted[uri] = tmp.name
+            except (KeyError, OSError) as e:
+                print(f"Error in get_archive_file: {e}")
+                self._extracted[uri] = ""
+        return self._extracted[uri]
+
+    def get_mindmanager_object(self):
+        return None
+
+    def get_active_document_object(self):
+        return self._path if self.document_exists() else None
+
+    def get_library_folder(self):
+        return ""
+
+    def get_version(self):
+        if not self._version and self.document_exists():
+            self._load()
+        return self._version
+
+    def set_document_background_image(self, path):
+        pass
+
+    def document_exists(self):
+        return self._central_topic is not None or os.path.exists(self._path)
+
+    def get_central_topic(self) -> 'MindmapTopic':
+        try:
+            return self._load()
+        except Exception as e:
+            raise Exception(f"Error getting central topic: {e}")
+
+    def get_mindmaptopic_from_topic(self, topic) -> 'MindmapTopic':
+        return MindmapTopic(
+            guid=topic.guid,
+            text=topic.text,
+            rtf=topic.rtf,
+            level=topic.level,
+        )
+
+    def get_mindmaptopic_from_topic_content(self, topic) -> 'MindmapTopic':
+        mindmap_topic = self.get_mindmaptopic_from_topic(topic)
+        mindmap_topic.notes = self.get_notes_from_topic(topic)
+        return mindmap_topic
+
+    def get_mindmaptopic_from_topic_full(self, topic) -> 'MindmapTopic':
+        mindmap_topic = self.get_mindmaptopic_from_topic(topic)
+        mindmap_topic.notes = self.get_notes_from_topic(topic)
+        mindmap_topic.links = self.get_links_from_topic(topic)
+        mindmap_topic.image = self.get_image_from_topic(topic)
+        mindmap_topic.icons = self.get_icons_from_topic(topic)
+        mindmap_topic.tags = self.get_tags_from_topic(topic)
+        mindmap_topic.references = self.get_references_from_topic(topic)
+        return mindmap_topic
+
+    def get_topic_by_id(self, id):
+        self._load()
+        return self._topics.get(id)
+
+    def get_selection(self):
+        self._load()
+        return [self._topics[guid] for guid in self._selection if guid in self._topics]
+
+    def get_level_from_topic(self, topic):
+        return topic.level
+
+    def get_text_from_topic(self, topic):
+        return topic.text
+
+    def get_title_from_topic(self, topic):
+        return topic.rtf
+
+    def get_subtopics_from_topic(self, topic):
+        return topic.subtopics
+
+    def get_links_from_topic(self, topic) -> list[MindmapLink]:
+        return [MindmapLink(text=link.text, url=link.url, guid=link.guid) for link in topic.links]
+
+    def get_image_from_topic(self, topic) -> MindmapImage:
+        if topic.image:
+            return MindmapImage(text=self.get_archive_file(topic.image.text))
+        return None
+
+    def get_icons_from_topic(self, topic) -> list[MindmapIcon]:
+        return [
+            MindmapIcon(
+                text=icon.text,
+                is_stock_icon=icon.is_stock_icon,
+                index=icon.index,
+                signature=icon.signature,
+                path=self.get_archive_file(icon.path) if icon.path else "",
+                group=icon.group,
+            )
+            for icon in topic.icons
+        ]
+
+    def get_notes_from_topic(self, topic) -> MindmapNotes:
+        if topic.notes:
+            return MindmapNotes(text=topic.notes.text, xhtml=topic.notes.xhtml, rtf=topic.notes.rtf)
+        return None
+
+    def get_tags_from_topic(self, topic) -> list[MindmapTag]:
+        return [MindmapTag(text=tag.text) for tag in topic.tags]
+
+    def get_references_from_topic(self, topic) -> list[MindmapReference]:
+        return [
+            MindmapReference(guid_1=ref.guid_1, guid_2=ref.guid_2, direction=ref.direction, label=ref.label)
+            for ref in topic.references
+        ]
+
+    def get_guid_from_topic(self, topic) -> str:
+        return topic.guid if topic else ""
+
+    def get_parent_from_topic(self, topic):
+        return topic.parent
+
+    def add_subtopic_to_topic(self, topic, topic_text):
+        try:
+            subtopic = MindmapTopic(guid=str(uuid.uuid4()).upper(), level=topic.level + 1, parent=topic)
+            subtopic.text = topic_text
+            topic.subtopics.append(subtopic)
+            self._topics[subtopic.guid] = subtopic
+            return subtopic
+        except Exception as e:
+            print(f"Error in add_subtopic_to_topic: {e}")
+            return None
+
+    def set_text_to_topic(self, topic, topic_text):
+        try:
+            topic.text = topic_text
+        except Exception as e:
+            print(f"Error in set_text_to_topic: {e}")
+
+    def set_title_to_topic(self, topic, topic_rtf):
+        try:
+            if topic_rtf != "":
+                topic.rtf = topic_rtf
+        except Exception as e:
+            print(f"Error in set_title_to_topic: {e}")
+
+    def add_tag_to_topic(self, topic=None, tag_text='', topic_guid=None):
+        try:
+            if topic_guid:
+                topic = self.get_topic_by_id(topic_guid)
+            if topic and tag_text not in [tag.text for tag in topic.tags]:
+                topic.tags.append(MindmapTag(text=tag_text))
+        except Exception as e:
+            print(f"Error in add_tag_to_topic: {e}")
+
+    def set_topic_from_mindmap_topic(self, topic, mindmap_topic, map_icons):
+        self.set_text_to_topic(topic, mindmap_topic.text)
+        self.set_title_to_topic(topic, mindmap_topic.rtf)
+        self.add_tags_to_topic(topic, mindmap_topic.tags)
+        self.set_notes_to_topic(topic, mindmap_topic.notes)
+        self.add_icons_to_topic(topic, mindmap_topic.icons, map_icons)
+        self.add_image_to_topic(topic, mindmap_topic.image)
+        self.add_links_to_topic(topic, mindmap_topic.links)
+        return topic, topic.guid
+
+    def add_links_to_topic(self, topic, mindmap_topic_links):
+        try:
+            if mindmap_topic_links:
+                for topic_link in mindmap_topic_links:
+                    if topic_link.guid == "" and topic_link.url != "":
+                        topic.links.append(MindmapLink(text=topic_link.text, url=topic_link.url))
+        except Exception as e:
+            print(f"Error in add_links_to_topic: {e}")
+
+    def add_image_to_topic(self, topic, mindmap_topic_image):
+        try:
+            if mindmap_topic_image:
+                topic.image = MindmapImage(text=mindmap_topic_image.text)
+        except Exception as e:
+            print(f"Error in add_image_to_topic: {e}")
+
+    def add_icons_to_topic(self, topic, mindmap_topic_icons, map_icons):
+        try:
+            if len(mindmap_topic_icons) > 0:
+                for topic_icon in mindmap_topic_icons:
+                    if topic_icon.is_stock_icon:
+                        topic.icons.append(MindmapIcon(text=topic_icon.text, index=topic_icon.index))
+                    else:
+                        if len(map_icons) > 0 and topic_icon.signature in self._icon_markers:
+                            name, group, path = self._icon_markers[topic_icon.signature]
+                            topic.icons.append(MindmapIcon(text=name, is_stock_icon=False, signature=topic_icon.signature, path=path, group=group))
+                        else:
+                            if os.path.exists(topic_icon.path):
+                                signature = icon_signature(topic_icon.path)
+                                topic.icons.append(MindmapIcon(
+                                    text=topic_icon.text,
+                                    is_stock_icon=False,
+                                    signature=signature,
+                                    path=topic_icon.path,
+                                    group=topic_icon.group,
+                                ))
+                                if topic_icon.text or topic_icon.group:
+                                    # keep name and group as marker, the icon itself only stores the signature
+                                    self._icon_markers.setdefault(signature, (topic_icon.text, topic_icon.group, topic_icon.path))
+        except Exception as e:
+            print(f"Error in add_icons_to_topic: {e}")
+
+    def set_notes_to_topic(self, topic, mindmap_topic_notes):
+        try:
+            if mindmap_topic_notes and (mindmap_topic_notes.text or mindmap_topic_notes.xhtml):
+                topic.notes = MindmapNotes(text=mindmap_topic_notes.text, xhtml=mindmap_topic_notes.xhtml)
+        except Exception as e:
+            print(f"Error in set_notes_to_topic: {e}")
+
+    def add_tags_to_topic(self, topic, mindmap_topic_tags):
+        try:
+            if len(mindmap_topic_tags) > 0:
+                for topic_tag in mindmap_topic_tags:
+                    self.add_tag_to_topic(topic, topic_tag.text)
+        except Exception as e:
+            print(f"Error in add_tags_to_topic: {e}")
+
+    def create_map_icons(self, map_icons):
+        try:
+            if len(map_icons) > 0:
+                for map_icon in map_icons:
+                    if map_icon.path and os.path.exists(map_icon.path):
+                        map_icon.signature = icon_signature(map_icon.path)
+                        self._icon_markers[map_icon.signature] = (map_icon.text, map_icon.group, map_icon.path)
+        except Exception as e:
+            print(f"Error in create_map_icons: {e}")
+
+    def create_tags(self, tags: list['str'], DUPLICATED_TAG: str):
+        try:
+            if len(tags) > 0:
+                self._tags = list(tags)
+                if DUPLICATED_TAG != '' and DUPLICATED_TAG not in tags:
+                    self._tags.append(DUPLICATED_TAG)
+        except Exception as e:
+            print(f"Error in create_tags: {e}")
+
+    def add_relationship(self, guid1, guid2, label=''):
+        try:
+            object1 = self.get_topic_by_id(guid1)
+            object2 = self.get_topic_by_id(guid2)
+            if object1 and object2:
+                if object1.parent is object2 or object2.parent is object1:
+                    return
+                self._relationships.append((guid1, guid2))
+                object1.references.append(MindmapReference(guid_1=guid1, guid_2=guid2, direction=1, label=label))
+                object2.references.append(MindmapReference(guid_1=guid1, guid_2=guid2, direction=2, label=label))
+        except Exception as e:
+            print(f"Error in add_relationship: {e}")
+
+    def add_topic_link(self, guid1, guid2, label=''):
+        try:
+            object1 = self.get_topic_by_id(guid1)
+            object2 = self.get_topic_by_id(guid2)
+            if object1 and object2:
+                object1.links.append(MindmapLink(text=label if label != "" else object2.text, guid=guid2))
+        except Exception as e:
+            print(f"Error in add_topic_link: {e}")
+
+    def add_document(self, max_topic_level):
+        self._central_topic = MindmapTopic(guid=str(uuid.uuid4()).upper(), text=DEFAULT_TOPIC_TEXTS[0], level=0)
+        self._topics = {self._central_topic.guid: self._central_topic}
+        self._selection = []
+        self._version = WRITER_VERSION.split(".")[0]
+        self._extracted = {}
+        self._relationships = []
+        self._icon_markers = {}
+        self._tags = []
+        self._created = True
+
+    def finalize(self, max_topic_level):
+        """
+        Write the document to the .mmap file. Topics below the outer levels are collapsed
+        like MindManager's finalize does for a live document.
+        """
+        try:
+            if not self._created:
+                return
+            writer = MmapWriter(
+                self._central_topic,
+                relationships=self._relationships,
+                icon_markers=self._icon_markers,
+                tags=self._tags,
+                collapse_level=2 if max_topic_level > 3 else 3,
+            )
+            writer.write(self._path)
+        except Exception as e:
+            print(f"Error in finalize: {e}")
@@ -40,6 +40,8 @@ class Mindmanager:
         self._charttype = charttype
         self._library_folder = self.WINDOWS_LIBRARY_FOLDER
         self._document = self._mindmanager.ActiveDocument
+        # topics created or looked up in the current document, keyed by GUID
+        self._topics = {}
     
     def get_mindmanager_object(self):
         return self._mindmanager
@@ -101,9 +103,35 @@ class Mindmanager:
         mindmap_topic.references = self.get_references_from_topic(topic)
         return mindmap_topic
     
+    def get_mindmaptopics_from_document(self, mode='full') -> list[tuple['MindmapTopic', str]]:
+        topics = []
+        try:
+            for topic in self._document.Range(2, True):  # 2 = all topics
+                try:
+                    if topic.IsFloatingTopic:
+                        continue
+                    if mode == 'full':
+                        mindmap_topic = self.get_mindmaptopic_from_topic_full(topic)
+                    elif mode == 'content':
+                        mindmap_topic = self.get_mindmaptopic_from_topic_content(topic)
+                    else:
+                        mindmap_topic = self.get_mindmaptopic_from_topic(topic)
+                    parent = topic.ParentTopic if mindmap_topic.level > 0 else None
+                    topics.append((mindmap_topic, parent.Guid if parent else ""))
+                except Exception as e:
+                    print(f"Error in get_mindmaptopics_from_document, reading topic: {e}")
+        except Exception as e:
+            print(f"Error in get_mindmaptopics_from_document: {e}")
+        return topics
+
     def get_topic_by_id(self, id):
         try:
-            return self._document.FindByGuid(id)
+            topic = self._topics.get(id)
+            if topic is None:
+                topic = self._document.FindByGuid(id)
+                if topic is not None:
+                    self._topics[id] = topic
+            return topic
         except Exception as e:
             print(f"Error in get_topic_by_id: {e}")
             return None
@@ -307,7 +335,9 @@ class Mindmanager:
         self.add_icons_to_topic(topic, mindmap_topic.icons, map_icons)
         self.add_image_to_topic(topic, mindmap_topic.image)
         self.add_links_to_topic(topic, mindmap_topic.links)
-        return topic, topic.Guid
+        topic_guid = topic.Guid
+        self._topics[topic_guid] = topic
+        return topic, topic_guid
     
     def add_links_to_topic(self, topic, mindmap_topic_links):
         try:
@@ -421,6 +451,7 @@ class Mindmanager:
             new_document = self._mindmanager.Documents.Add()
             new_document.StyleXml = style
             self._document = new_document
+            self._topics = {}
         except Exception as e:
             print(f"Error in add_document: {e}")
 
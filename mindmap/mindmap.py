@@ -1,6 +1,8 @@
 import uuid
 
 import mindm.mindmanager as mm
+from mindmap.operations import MindmapOperationExecutor, MindmapOperationLog
+from mindmap.traversal import iter_preorder
 
 DUPLICATED_TAG = 'Duplicated'
 DUPLICATE_LABEL = 'DUPLICATE'
@@ -147,8 +149,20 @@ class MindmapTopic:
         self.subtopics = subtopics if subtopics is not None else []
 
 
+class MapAnalysis:
+    def __init__(self):
+        """
+        Results of the single walk over a mindmap which prepares its creation.
+        """
+        self.guid_counts: dict[str, dict[str, int]] = {}
+        self.parents: dict[str, str] = {}
+        self.tags: list[str] = []
+        self.map_icons: list['MindmapIcon'] = []
+        self.relationships: list['MindmapReference'] = []
+        self.links: list['MindmapReference'] = []
+
 class MindmapDocument:
-    def __init__(self, charttype: str = 'auto', turbo_mode: bool = False, inline_editing_mode: bool = False, mermaid_mode: bool = True, macos_access: str = 'appscript'):
+    def __init__(self, charttype: str = 'auto', turbo_mode: bool = False, inline_editing_mode: bool = False, mermaid_mode: bool = True, macos_access: str = 'appscript', mmap_path: str = None):
         """
         Initialize a MindmapDocument instance which automates MindManager operations.
 
@@ -158,6 +172,7 @@ class MindmapDocument:
             inline_editing_mode (bool): Flag for enabling inline editing mode.
             mermaid_mode (bool): Flag for enabling mermaid mode.
             macos_access (str): Method for accessing macOS features (default is 'appscript', alternative is 'applescript').
+            mmap_path (str, optional): Path to a .mmap file to work on directly instead of a running MindManager instance.
         """
         self.charttype: str = charttype
         self.turbo_mode: bool = turbo_mode
@@ -170,8 +185,13 @@ class MindmapDocument:
         self.selected_topic_levels: list[int] = []
         self.selected_topic_ids: list[str] = []
         self.max_topic_level: int = 0
+        self.operations: 'MindmapOperationLog' = None
+        self.topic_index: dict[str, 'MindmapTopic'] = {}
+        self.created_handles: dict[str, list] = {}
+        self._indexed_mindmap: 'MindmapTopic' = None
         self.macos_access = macos_access
-        self.mindm = mm.Mindmanager(charttype, macos_access)
+        self.mmap_path: str = mmap_path
+        self.mindm = mm.Mindmanager(charttype, macos_access, mmap_path)
 
     def get_mindmap(self, topic=None, mode='full'):
         """
@@ -186,21 +206,156 @@ class MindmapDocument:
             bool: True if the mind map was successfully retrieved, otherwise False.
         """
         if self.macos_access == 'applescript' and self.mindm.platform == 'darwin':
-            # get whole mindmap
-            mindmap = self.mindm.get_central_topic()
-        else:
             if topic is None:
-                topic = self.mindm.get_central_topic()
-            
-            mindmap = self.get_mindmap_topic_from_topic(self.mindm.get_topic_by_id(topic.guid), mode=mode)
+                # get whole mindmap
+                mindmap = self.mindm.get_central_topic()
+            else:
+                mindmap = self.mindm.get_subtree_from_topic(topic.guid)
+        else:
+            mindmap = None
+            if topic is None and self.mindm.platform == 'win':
+                # one pass over all topics instead of walking the tree topic by topic
+                mindmap = self.build_mindmap_from_topics(self.mindm.get_mindmaptopics_from_document(mode))
+            if mindmap is None:
+                if topic is None:
+                    topic = self.mindm.get_central_topic()
+                mindmap = self.get_mindmap_topic_from_topic(self.mindm.get_topic_by_id(topic.guid), mode=mode)
 
         self.max_topic_level = self.get_max_topic_level(mindmap)
         self.mindmap = mindmap
+        self.index_topics()
         return True
+
+    def index_topics(self):
+        """
+        Rebuild the GUID index of the current mindmap. The first occurrence of a GUID wins.
+        """
+        self.topic_index = {}
+        self._indexed_mindmap = self.mindmap
+        if self.mindmap is not None:
+            self._index_subtree(self.mindmap)
+
+    def _index_subtree(self, mindmap_topic):
+        seen = set()
+        stack = [mindmap_topic]
+        while stack:
+            topic = stack.pop()
+            if id(topic) in seen:
+                continue
+            seen.add(id(topic))
+            if topic.guid and topic.guid not in self.topic_index:
+                self.topic_index[topic.guid] = topic
+            stack.extend(reversed(topic.subtopics))
+
+    def _unindex_subtree(self, mindmap_topic):
+        seen = set()
+        stack = [mindmap_topic]
+        while stack:
+            topic = stack.pop()
+            if id(topic) in seen:
+                continue
+            seen.add(id(topic))
+            if self.topic_index.get(topic.guid) is topic:
+                del self.topic_index[topic.guid]
+            stack.extend(topic.subtopics)
+
+    def get_topic_by_guid(self, guid):
+        """
+        Look up a topic of the current mindmap by its GUID.
+
+        Args:
+            guid (str): The GUID of the topic.
+
+        Returns:
+            MindmapTopic or None: The topic, or None if the GUID is unknown.
+        """
+        if self._indexed_mindmap is not self.mindmap:
+            self.index_topics()
+        return self.topic_index.get(guid)
+
+    def add_topic(self, parent, mindmap_topic):
+        """
+        Attach a topic (including its subtopics) to a parent topic and add it to the GUID index.
+
+        Args:
+            parent (MindmapTopic): The new parent topic.
+            mindmap_topic (MindmapTopic): The topic to attach.
+        """
+        if self._indexed_mindmap is not self.mindmap:
+            self.index_topics()
+        self._set_subtree_level(mindmap_topic, parent.level + 1)
+        mindmap_topic.parent = parent
+        parent.subtopics.append(mindmap_topic)
+        self._index_subtree(mindmap_topic)
+        self.max_topic_level = max(self.max_topic_level, self.get_max_topic_level(mindmap_topic))
+
+    def remove_topic(self, mindmap_topic):
+        """
+        Detach a topic (including its subtopics) from its parent and remove it from the GUID index.
+
+        Args:
+            mindmap_topic (MindmapTopic): The topic to detach.
+        """
+        if self._indexed_mindmap is not self.mindmap:
+            self.index_topics()
+        parent = mindmap_topic.parent
+        if parent is not None and mindmap_topic in parent.subtopics:
+            parent.subtopics.remove(mindmap_topic)
+        mindmap_topic.parent = None
+        self._unindex_subtree(mindmap_topic)
+
+    def move_topic(self, mindmap_topic, parent):
+        """
+        Move a topic (including its subtopics) to a new parent topic.
+
+        Args:
+            mindmap_topic (MindmapTopic): The topic to move.
+            parent (MindmapTopic): The new parent topic.
+        """
+        self.remove_topic(mindmap_topic)
+        self.add_topic(parent, mindmap_topic)
+
+    def _set_subtree_level(self, mindmap_topic, level):
+        delta = level - (mindmap_topic.level or 0)
+        if delta == 0:
+            return
+        seen = set()
+        stack = [mindmap_topic]
+        while stack:
+            topic = stack.pop()
+            if id(topic) in seen:
+                continue
+            seen.add(id(topic))
+            topic.level = (topic.level or 0) + delta
+            stack.extend(topic.subtopics)
     
+    def build_mindmap_from_topics(self, topics):
+        """
+        Rebuild the topic hierarchy from a flat list of topics and their parent GUIDs.
+
+        Args:
+            topics (list[tuple[MindmapTopic, str]]): (topic, parent GUID) tuples in document order.
+                The central topic has an empty parent GUID.
+
+        Returns:
+            MindmapTopic or None: The central topic, or None if it is missing.
+        """
+        by_guid = {mindmap_topic.guid: mindmap_topic for mindmap_topic, _ in topics}
+        root = None
+        for mindmap_topic, parent_guid in topics:
+            if not parent_guid:
+                if root is None:
+                    root = mindmap_topic
+                continue
+            parent = by_guid.get(parent_guid)
+            if parent is not None:
+                mindmap_topic.parent = parent
+                parent.subtopics.append(mindmap_topic)
+        return root
+
     def get_max_topic_level(self, mindmap_topic, max_topic_level=0, visited=None):
         """
-        Recursively compute the maximum topic level within the mind map.
+        Compute the maximum topic level within the mind map.
 
         Args:
             mindmap_topic (MindmapTopic): The current topic to evaluate.
@@ -215,10 +370,16 @@ class MindmapDocument:
         if mindmap_topic.guid in visited:
             return max_topic_level
         visited.add(mindmap_topic.guid)
-        for subtopic in mindmap_topic.subtopics:
-            if subtopic.level > max_topic_level:
-                max_topic_level = subtopic.level
-            max_topic_level = self.get_max_topic_level(subtopic, max_topic_level, visited)
+
+        def children(topic):
+            if topic is not mindmap_topic and topic.guid in visited:
+                return []
+            visited.add(topic.guid)
+            return topic.subtopics
+
+        for _, topic, parent in iter_preorder(mindmap_topic, children):
+            if parent is not None and topic.level > max_topic_level:
+                max_topic_level = topic.level
         return max_topic_level
 
     def get_parent_topic(self, topic, visited=None):
@@ -234,26 +395,33 @@ class MindmapDocument:
         """
         if visited is None:
             visited = set()
-        topic_guid = self.mindm.get_guid_from_topic(topic)
-        if topic_guid in visited:
-            return None
-        visited.add(topic_guid)
-        topic_level = self.mindm.get_level_from_topic(topic)
-        if topic_level == 0:
-            return None
-        parent_topic = self.mindm.get_parent_from_topic(topic)
-        if parent_topic is None:
-            return None
-        parent_guid = self.mindm.get_guid_from_topic(parent_topic)
-        if parent_guid == topic_guid:
-            return None
-        parent_mindmap_topic = MindmapTopic(
-            guid=parent_guid,
-            text=self.mindm.get_text_from_topic(parent_topic), 
-            level=self.mindm.get_level_from_topic(parent_topic),
-            parent=self.get_parent_topic(parent_topic, visited),
-        )
-        return parent_mindmap_topic
+        root = None
+        child = None
+        while True:
+            topic_guid = self.mindm.get_guid_from_topic(topic)
+            if topic_guid in visited:
+                break
+            visited.add(topic_guid)
+            if self.mindm.get_level_from_topic(topic) == 0:
+                break
+            parent_topic = self.mindm.get_parent_from_topic(topic)
+            if parent_topic is None:
+                break
+            parent_guid = self.mindm.get_guid_from_topic(parent_topic)
+            if parent_guid == topic_guid:
+                break
+            parent_mindmap_topic = MindmapTopic(
+                guid=parent_guid,
+                text=self.mindm.get_text_from_topic(parent_topic),
+                level=self.mindm.get_level_from_topic(parent_topic),
+            )
+            if child is None:
+                root = parent_mindmap_topic
+            else:
+                child.parent = parent_mindmap_topic
+            child = parent_mindmap_topic
+            topic = parent_topic
+        return root
 
     def get_selection(self):
         """
@@ -262,6 +430,11 @@ class MindmapDocument:
         Returns:
             list[MindmapTopic]: A list of MindmapTopic instances representing the selection.
         """
+        if self.mindm.platform == 'darwin' and self.macos_access == 'applescript':
+            mindmap_topics = self.get_selection_batched()
+            self.get_topic_texts_from_selection(mindmap_topics)
+            return mindmap_topics
+
         selection = self.mindm.get_selection()
         mindmap_topics = []
         for topic in selection:
@@ -277,9 +450,59 @@ class MindmapDocument:
         self.get_topic_texts_from_selection(mindmap_topics)
         return mindmap_topics
 
+    def get_selection_batched(self):
+        """
+        Retrieve the selected topics and their parent chains level by level, with one batched
+        connector call per level instead of several calls per topic (macOS AppleScript).
+
+        Returns:
+            list[MindmapTopic]: A list of MindmapTopic instances representing the selection.
+        """
+        selection = self.mindm.get_selection() or []
+        known = {topic.guid: topic for topic in selection}
+        parent_ids = {}
+        pending = [topic.guid for topic in selection if topic.level != 0]
+        while pending:
+            parents = self.mindm.get_parents_from_topics(pending)
+            missing = []
+            for guid in pending:
+                parent_guid = parents.get(guid, "")
+                if parent_guid and parent_guid != guid:
+                    parent_ids[guid] = parent_guid
+                    if parent_guid not in known and parent_guid not in missing:
+                        missing.append(parent_guid)
+            for topic in self.mindm.get_mindmaptopics(missing, mode='text'):
+                known[topic.guid] = topic
+            pending = [guid for guid in missing if guid in known and known[guid].level != 0]
+
+        ancestors = {}
+        def ancestor(guid):
+            if guid not in ancestors:
+                ancestors[guid] = None
+                topic = known.get(guid)
+                if topic is not None:
+                    ancestors[guid] = MindmapTopic(
+                        guid=guid,
+                        text=topic.text,
+                        level=topic.level,
+                        parent=ancestor(parent_ids[guid]) if guid in parent_ids else None,
+                    )
+            return ancestors[guid]
+
+        return [
+            MindmapTopic(
+                guid=topic.guid,
+                text=topic.text,
+                level=topic.level,
+                parent=ancestor(parent_ids[topic.guid]) if topic.guid in parent_ids else None,
+                selected=True,
+            )
+            for topic in selection
+        ]
+
     def get_mindmap_topic_from_topic(self, topic, parent_topic=None, mode='full'):
         """
-        Recursively convert a MindManager topic into a MindmapTopic object.
+        Convert a MindManager topic and all its subtopics into MindmapTopic objects.
 
         Args:
             topic: The current MindManager topic to convert.
@@ -289,21 +512,105 @@ class MindmapDocument:
         Returns:
             MindmapTopic: The converted topic with its subtopics.
         """
-        if mode == 'full':
-            mindmap_topic = self.mindm.get_mindmaptopic_from_topic_full(topic)
-            mindmap_topic.parent = parent_topic
-        elif mode == 'content':
-            mindmap_topic = self.mindm.get_mindmaptopic_from_topic_content(topic)
-        else:
-            mindmap_topic = self.mindm.get_mindmaptopic_from_topic(topic)
+        # frames are [MindManager topic, MindmapTopic]; the MindmapTopic is set when the frame is visited
+        def children(frame):
+            return [[subtopic, None] for subtopic in self.mindm.get_subtopics_from_topic(frame[0])]
+
+        root = [topic, None]
+        for _, frame, parent_frame in iter_preorder(root, children):
+            parent = parent_frame[1] if parent_frame is not None else parent_topic
+            if mode == 'full':
+                mindmap_topic = self.mindm.get_mindmaptopic_from_topic_full(frame[0])
+                mindmap_topic.parent = parent
+            elif mode == 'content':
+                mindmap_topic = self.mindm.get_mindmaptopic_from_topic_content(frame[0])
+            else:
+                mindmap_topic = self.mindm.get_mindmaptopic_from_topic(frame[0])
+            mindmap_topic.subtopics = []
+            if parent_frame is not None:
+                parent_frame[1].subtopics.append(mindmap_topic)
+            frame[1] = mindmap_topic
+        return root[1]
+
+    def analyze_mindmap(self, mindmap):
+        """
+        Collect everything create_mindmap needs in one iterative walk: parent/child counts, parents,
+        unique tags, unique map icons (fixing the icon references of the topics), relationships and
+        topic links. The results equal those of the separate get_*_from_mindmap walks.
 
-        subtopics = self.mindm.get_subtopics_from_topic(topic)
-        mindmap_subtopics = []
-        for subtopic in subtopics:
-            child = self.get_mindmap_topic_from_topic(subtopic, parent_topic=mindmap_topic, mode=mode)
-            mindmap_subtopics.append(child)
-        mindmap_topic.subtopics = mindmap_subtopics
-        return mindmap_topic 
+        Args:
+            mindmap (MindmapTopic): The central topic of the mindmap.
+
+        Returns:
+            MapAnalysis: The collected data.
+        """
+        analysis = MapAnalysis()
+        guid_counts = analysis.guid_counts
+        parents = analysis.parents
+        tag_set = set()
+        icons_by_signature = {}
+        visited = set()
+
+        # (topic, parent topic) pairs in the order of the recursive walks
+        stack = [(mindmap, None)]
+        while stack:
+            topic, parent = stack.pop()
+            if parent is not None:
+                if parent.guid:
+                    guid_counts[parent.guid]['parent'] += 1
+                if topic.guid:
+                    guid_counts.setdefault(topic.guid, {'parent': 0, 'child': 0})['child'] += 1
+            if str(topic.guid) == '':
+                topic.guid = str(uuid.uuid4())
+            if parent is not None and topic.guid not in parents:
+                parents[topic.guid] = parent.guid
+            if topic.guid in visited:
+                continue
+            visited.add(topic.guid)
+            guid_counts.setdefault(topic.guid, {'parent': 0, 'child': 0})
+
+            for tag in topic.tags:
+                if tag.text != '' and tag.text not in tag_set:
+                    tag_set.add(tag.text)
+                    analysis.tags.append(tag.text)
+
+            for i, topic_icon_ref in enumerate(topic.icons):
+                # Only process non-stock icons belonging to the 'Types' group
+                if not topic_icon_ref.is_stock_icon and topic_icon_ref.group == 'Types':
+                    new_icon = icons_by_signature.get(topic_icon_ref.signature)
+                    if new_icon is None:
+                        new_icon = MindmapIcon(
+                            text=topic_icon_ref.text,
+                            index=topic_icon_ref.index,
+                            is_stock_icon=topic_icon_ref.is_stock_icon,
+                            path=topic_icon_ref.path,
+                            signature=topic_icon_ref.signature,
+                            group=topic_icon_ref.group)
+                        icons_by_signature[topic_icon_ref.signature] = new_icon
+                        analysis.map_icons.append(new_icon)
+                    topic.icons[i] = new_icon
+
+            for reference in topic.references:
+                if reference.direction == 1:
+                    analysis.relationships.append(MindmapReference(
+                        guid_1=reference.guid_1,
+                        guid_2=reference.guid_2,
+                        direction=reference.direction,
+                        label=reference.label
+                    ))
+
+            for link in topic.links:
+                if link.guid != '':
+                    analysis.links.append(MindmapReference(
+                        guid_1=topic.guid,
+                        guid_2=link.guid,
+                        direction=1,
+                        label=link.text
+                    ))
+
+            for subtopic in reversed(topic.subtopics):
+                stack.append((subtopic, topic))
+        return analysis
 
     def get_relationships_from_mindmap(self, mindmap, references, visited=None):
         """
@@ -514,38 +821,96 @@ class MindmapDocument:
             subtopics=cloned_subtopics
         )
 
-    def update_done(self, topic_guid, mindmap_topic, level, done, done_global):
+    def update_done(self, topic_guid, mindmap_topic, level, done, done_global, operations=None):
         """
         Update tracking dictionaries for processed topics and create duplicate links/tags.
 
         Args:
-            topic_guid (str): The GUID of the current topic in MindManager.
+            topic_guid (str): The GUID of the current topic in MindManager (or its reference in the operation log).
             mindmap_topic (MindmapTopic): The MindmapTopic being processed.
             level (int): The current level in the topic hierarchy.
             done (dict): Dictionary tracking topics processed at a given level.
             done_global (dict): Global dictionary tracking processed topics for duplicate detection.
+            operations (MindmapOperationLog, optional): If given, links and tags are recorded instead of written.
         """
         if mindmap_topic.guid == '':
             return
         if level <= 1:
             done = {}
         elif level >= 2: 
-            done[mindmap_topic.guid] = [topic_guid] if mindmap_topic.guid not in done else done[mindmap_topic.guid] + [topic_guid]
+            done.setdefault(mindmap_topic.guid, []).append(topic_guid)
         if mindmap_topic.guid in done_global:
             # Check for duplicate relationships and add links/tags accordingly.
             if self.guid_counts[mindmap_topic.guid]['child'] < 11 and self.guid_counts[mindmap_topic.guid]['parent'] >= 0:
                 for i in range(len(done_global[mindmap_topic.guid])):
                     link_from = topic_guid
                     link_to = done_global[mindmap_topic.guid][i]
-                    self.mindm.add_topic_link(link_from, link_to, DUPLICATE_LABEL)
-                    self.mindm.add_topic_link(link_to, link_from, DUPLICATE_LABEL)
+                    if operations is None:
+                        self.mindm.add_topic_link(link_from, link_to, DUPLICATE_LABEL)
+                        self.mindm.add_topic_link(link_to, link_from, DUPLICATE_LABEL)
+                    else:
+                        operations.link(link_from, link_to, mindmap_topic.guid, DUPLICATE_LABEL)
+                        operations.link(link_to, link_from, mindmap_topic.guid, DUPLICATE_LABEL)
                 if len(done_global[mindmap_topic.guid]) == 1:
-                    self.mindm.add_tag_to_topic(topic=None, tag_text=DUPLICATED_TAG, topic_guid=done_global[mindmap_topic.guid][0])
-            self.mindm.add_tag_to_topic(topic=None, tag_text=DUPLICATED_TAG, topic_guid=topic_guid)
-            done_global[mindmap_topic.guid] = done_global[mindmap_topic.guid] + [topic_guid]
+                    if operations is None:
+                        self.mindm.add_tag_to_topic(topic=None, tag_text=DUPLICATED_TAG, topic_guid=done_global[mindmap_topic.guid][0])
+                    else:
+                        operations.tag(done_global[mindmap_topic.guid][0], mindmap_topic.guid, DUPLICATED_TAG)
+            if operations is None:
+                self.mindm.add_tag_to_topic(topic=None, tag_text=DUPLICATED_TAG, topic_guid=topic_guid)
+            else:
+                operations.tag(topic_guid, mindmap_topic.guid, DUPLICATED_TAG)
+            done_global[mindmap_topic.guid].append(topic_guid)
         else:
             done_global[mindmap_topic.guid] = [topic_guid]
 
+    def plan_topic_operations(self, operations, ref, mindmap_topic, done=None, done_global=None, level=0):
+        """
+        Record the operations to create a MindManager topic tree from a MindmapTopic instance.
+
+        Args:
+            operations (MindmapOperationLog): The log to record to.
+            ref (int): The reference of the topic which receives the properties of mindmap_topic.
+            mindmap_topic (MindmapTopic): The source MindmapTopic data.
+            done (dict, optional): Dictionary tracking processed topics at current level.
+            done_global (dict, optional): Global dictionary mapping source GUIDs to topic references.
+            level (int): Current hierarchical level.
+        """
+        if done is None:
+            done = {}
+        if done_global is None:
+            done_global = {}
+
+        # frames are [source topic, reference, expand]; subtopics are only decided on when they are reached,
+        # after the subtrees of their preceding siblings have been planned
+        def children(frame):
+            if not frame[2]:
+                return []
+            return [[subtopic, None, False] for subtopic in frame[0].subtopics]
+
+        for depth, frame, parent_frame in iter_preorder([mindmap_topic, ref, False], children):
+            try:
+                if parent_frame is not None:
+                    subtopic = frame[0]
+                    if not self.turbo_mode and subtopic.guid in done:
+                        if self.check_parent_exists(parent_frame[1], subtopic.guid):
+                            continue
+                        frame[0] = self.clone_mindmap_topic(subtopic)
+                    frame[1] = operations.create_topic(frame[0].guid, parent_frame[1], frame[0].text)
+                topic = frame[0]
+                if not self.turbo_mode:
+                    operations.set_props(frame[1], topic)
+                self.update_done(frame[1], topic, level + depth, done, done_global, operations)
+
+                if not self.turbo_mode and topic.subtopics and len(topic.subtopics) > 0:
+                    # Sort subtopics alphabetically by text
+                    topic.subtopics.sort(key=lambda sub: sub.text)
+                frame[2] = True
+            except Exception as e:
+                if parent_frame is None:
+                    raise
+                print(f"Error processing topic/subtopic {parent_frame[0].guid}/{frame[0].guid}: {e}")
+
     def set_topic_from_mindmap_topic(self, topic, mindmap_topic, map_icons, done=None, done_global=None, level=0):
         """
         Create or update a MindManager topic from a MindmapTopic instance recursively.
@@ -561,48 +926,18 @@ class MindmapDocument:
         Returns:
             MindmapTopic: The processed MindmapTopic.
         """
-        if done is None:
-            done = {}
-        if done_global is None:
-            done_global = {}
         try:
-            if self.turbo_mode:
-                topic_guid = self.mindm.get_guid_from_topic(topic)
-                self.update_done(topic_guid, mindmap_topic, level, done, done_global)
-                for subtopic in mindmap_topic.subtopics:
-                    try:
-                        sub = self.mindm.add_subtopic_to_topic(topic, subtopic.text)
-                        self.set_topic_from_mindmap_topic(sub, subtopic, map_icons, done, done_global, level + 1)
-                    except Exception as e:
-                        print(f"Error(1) processing topic/subtopic {mindmap_topic.guid}/{subtopic.guid}: {e}")
-            else:
-                topic, topic_guid = self.mindm.set_topic_from_mindmap_topic(topic, mindmap_topic, map_icons)
-                self.update_done(topic_guid, mindmap_topic, level, done, done_global)
-
-                if mindmap_topic.subtopics and len(mindmap_topic.subtopics) > 0:
-                    # Sort subtopics alphabetically by text
-                    mindmap_topic.subtopics.sort(key=lambda sub: sub.text)
-
-                for subtopic in mindmap_topic.subtopics:
-                    try:
-                        if subtopic.guid in done:
-                            this_guid_as_parent_exists = self.check_parent_exists(topic_guid, subtopic.guid)
-                            if not this_guid_as_parent_exists:
-                                cloned_subtopic = self.clone_mindmap_topic(subtopic)
-                                sub = self.mindm.add_subtopic_to_topic(topic, cloned_subtopic.text)
-                                self.set_topic_from_mindmap_topic(sub, cloned_subtopic, map_icons, done, done_global, level + 1)
-                        else:
-                            sub = self.mindm.add_subtopic_to_topic(topic, subtopic.text)
-                            self.set_topic_from_mindmap_topic(sub, subtopic, map_icons, done, done_global, level + 1)
-                    except Exception as e:
-                        print(f"Error(2) processing topic/subtopic {mindmap_topic.guid}/{subtopic.guid}: {e}")
+            operations = MindmapOperationLog()
+            ref = operations.new_ref()
+            self.plan_topic_operations(operations, ref, mindmap_topic, done, done_global, level)
+            operations.replay(self.mindm, map_icons, handles={ref: topic})
             return mindmap_topic
         except Exception as e:
             print(f"Error in set_topic_from_mindmap_topic at level {level} with topic {mindmap_topic.guid}: {e}")
 
     def check_parent_exists(self, topic_guid, this_guid, visited=None):
         """
-        Recursively check if a parent-child relationship exists between topics.
+        Check if a parent-child relationship exists between topics by following the parent chain.
 
         Args:
             topic_guid (str): The GUID of the topic to check.
@@ -614,18 +949,12 @@ class MindmapDocument:
         """
         if visited is None:
             visited = set()
-        if topic_guid in visited:
-            return False
-        visited.add(topic_guid)
-        
-        check = False
-        if topic_guid in self.parents:
-            parent_guid = self.parents[topic_guid]
-            if parent_guid == this_guid:
-                check = True
-            else:
-                check = self.check_parent_exists(parent_guid, this_guid, visited)
-        return check
+        while topic_guid not in visited and topic_guid in self.parents:
+            visited.add(topic_guid)
+            topic_guid = self.parents[topic_guid]
+            if topic_guid == this_guid:
+                return True
+        return False
 
     def create_mindmap(self, verbose=False):
         """
@@ -635,55 +964,62 @@ class MindmapDocument:
         Args:
             verbose (bool): (Optional) Enable verbose output.
         """
-        tags = []
-        map_icons = []
-        relationships = []
-        links = []
-
-        self.parents = {}
-        self.guid_counts = {}
-        self.count_parent_and_child_occurrences(self.mindmap, self.guid_counts)
-        self.get_parents_from_mindmap(self.mindmap, self.parents)
-
-        self.get_tags_from_mindmap(self.mindmap, tags)
-        self.get_map_icons_and_fix_refs_from_mindmap(self.mindmap, map_icons)
-        self.get_relationships_from_mindmap(self.mindmap, relationships)
-        self.get_topic_links_from_mindmap(self.mindmap, links)
+        analysis = self.analyze_mindmap(self.mindmap)
+        self.parents = analysis.parents
+        self.guid_counts = analysis.guid_counts
+        tags = analysis.tags
+        map_icons = analysis.map_icons
+        relationships = analysis.relationships
+        links = analysis.links
 
         self.mindm.add_document(0)
         self.mindm.create_map_icons(map_icons)
         self.mindm.create_tags(tags, DUPLICATED_TAG)
 
         if self.mindm.platform == 'darwin' and self.macos_access == 'applescript':
+            # the whole tree is written with a single writeTree call
             self.mindm.set_topic_from_mindmap_topic(None, self.mindmap, map_icons)
             self.get_mindmap()
         else:
-            central_topic = self.mindm.get_central_topic()
-            self.mindm.set_text_to_topic(self.mindm.get_topic_by_id(central_topic.guid), self.mindmap.text)
+            self.operations = self.plan_mindmap(relationships, links)
+            if verbose:
+                print(f"Operations: {self.operations.counts()}")
+            executor = MindmapOperationExecutor(self.mindm, map_icons)
+            executor.execute(self.operations)
+            self.created_handles = executor.handles_by_source(self.operations)
+
+    def plan_mindmap(self, relationships, links):
+        """
+        Record all operations needed to create the mindmap in a new operation log.
 
-            done_global = {}
-            self.set_topic_from_mindmap_topic(
-                topic=self.mindm.get_topic_by_id(central_topic.guid),
-                mindmap_topic=self.mindmap,
-                map_icons=map_icons,
-                done={},
-                done_global=done_global)
-
-            # Create relationships between topics
-            for reference in relationships:
-                object1_guids = done_global[reference.guid_1]
-                object2_guids = done_global[reference.guid_2]
-                for object1_guid in object1_guids:
-                    for object2_guid in object2_guids:
-                        self.mindm.add_relationship(object1_guid, object2_guid, reference.label)
-
-            # Create topic links
-            for link in links:
-                object1_guids = done_global[link.guid_1]
-                object2_guids = done_global[link.guid_2]
-                for object1_guid in object1_guids:
-                    for object2_guid in object2_guids:
-                        self.mindm.add_topic_link(object1_guid, object2_guid, link.label)
+        Args:
+            relationships (list[MindmapReference]): The relationships between source topics.
+            links (list[MindmapLink]): The topic links between source topics.
+
+        Returns:
+            MindmapOperationLog: The operations, keyed by source GUID.
+        """
+        operations = MindmapOperationLog()
+        done_global = {}
+        root = operations.create_topic(self.mindmap.guid, None, self.mindmap.text)
+        self.plan_topic_operations(operations, root, self.mindmap, done={}, done_global=done_global)
+
+        # Create relationships between topics
+        for reference in relationships:
+            object1_refs = done_global[reference.guid_1]
+            object2_refs = done_global[reference.guid_2]
+            for object1_ref in object1_refs:
+                for object2_ref in object2_refs:
+                    operations.relate(object1_ref, object2_ref, reference.guid_1, reference.label)
+
+        # Create topic links
+        for link in links:
+            object1_refs = done_global[link.guid_1]
+            object2_refs = done_global[link.guid_2]
+            for object1_ref in object1_refs:
+                for object2_ref in object2_refs:
+                    operations.link(object1_ref, object2_ref, link.guid_1, link.label)
+        return operations
 
     def create_mindmap_and_finalize(self):
         """
@@ -0,0 +1,275 @@
+"""
+Write-ahead operation log for creating mindmaps.
+
+``MindmapDocument.create_mindmap`` first records every write as an operation
+(create-topic, set-props, tag, link, relate) keyed by the GUID of the source
+topic, and then replays the log against a connector. Created topics are
+addressed by references (``ref``) which are resolved to connector handles
+while the log is replayed, so a log can be inspected, timed and replayed
+against another connector.
+"""
+
+CREATE_TOPIC = 'create-topic'
+SET_PROPS = 'set-props'
+TAG = 'tag'
+LINK = 'link'
+RELATE = 'relate'
+
+# Operations are flushed phase by phase: the topic tree first, then everything which refers to created topics.
+PHASES = [(CREATE_TOPIC, SET_PROPS), (TAG,), (RELATE,), (LINK,)]
+
+
+class MindmapOperation:
+    def __init__(self,
+                 kind: str,
+                 ref: int,
+                 source_guid: str = '',
+                 parent_ref: int = None,
+                 target_ref: int = None,
+                 text: str = '',
+                 label: str = '',
+                 mindmap_topic=None):
+        self.kind = kind
+        self.ref = ref
+        self.source_guid = source_guid
+        self.parent_ref = parent_ref
+        self.target_ref = target_ref
+        self.text = text
+        self.label = label
+        self.mindmap_topic = mindmap_topic
+
+    def to_dict(self) -> dict:
+        """
+        Return a JSON serializable representation of the operation.
+
+        Returns:
+            dict: The operation without the source topic object.
+        """
+        return {
+            "op": self.kind,
+            "ref": self.ref,
+            "source_guid": self.source_guid,
+            "parent_ref": self.parent_ref,
+            "target_ref": self.target_ref,
+            "text": self.text,
+            "label": self.label,
+        }
+
+
+class MindmapOperationLog:
+    def __init__(self):
+        self.operations: list[MindmapOperation] = []
+        self._next_ref = 0
+
+    def __iter__(self):
+        return iter(self.operations)
+
+    def __len__(self):
+        return len(self.operations)
+
+    def new_ref(self) -> int:
+        """
+        Allocate a reference for a topic which is created or bound when the log is replayed.
+
+        Returns:
+            int: The new reference.
+        """
+        ref = self._next_ref
+        self._next_ref += 1
+        return ref
+
+    def create_topic(self, source_guid: str, parent_ref: int, text: str) -> int:
+        """
+        Record the creation of a subtopic. Without a parent reference the central topic is used.
+
+        Args:
+            source_guid (str): The GUID of the source topic.
+            parent_ref (int): The reference of the parent topic or None for the central topic.
+            text (str): The topic text.
+
+        Returns:
+            int: The reference of the created topic.
+        """
+        ref = self.new_ref()
+        self.operations.append(MindmapOperation(CREATE_TOPIC, ref, source_guid, parent_ref=parent_ref, text=text))
+        return ref
+
+    def set_props(self, ref: int, mindmap_topic) -> None:
+        """
+        Record setting all properties of a topic from a source topic.
+
+        Args:
+            ref (int): The reference of the topic to update.
+            mindmap_topic (MindmapTopic): The source topic.
+        """
+        self.operations.append(MindmapOperation(SET_PROPS, ref, mindmap_topic.guid, text=mindmap_topic.text, mindmap_topic=mindmap_topic))
+
+    def tag(self, ref: int, source_guid: str, tag_text: str) -> None:
+        """
+        Record adding a tag to a topic.
+
+        Args:
+            ref (int): The reference of the topic.
+            source_guid (str): The GUID of the source topic.
+            tag_text (str): The tag text.
+        """
+        self.operations.append(MindmapOperation(TAG, ref, source_guid, text=tag_text))
+
+    def link(self, ref: int, target_ref: int, source_guid: str = '', label: str = '') -> None:
+        """
+        Record a topic link between two topics.
+
+        Args:
+            ref (int): The reference of the source topic.
+            target_ref (int): The reference of the target topic.
+            source_guid (str): The GUID of the source topic.
+            label (str): The link label.
+        """
+        self.operations.append(MindmapOperation(LINK, ref, source_guid, target_ref=target_ref, label=label))
+
+    def relate(self, ref: int, target_ref: int, source_guid: str = '', label: str = '') -> None:
+        """
+        Record a relationship between two topics.
+
+        Args:
+            ref (int): The reference of the first topic.
+            target_ref (int): The reference of the second topic.
+            source_guid (str): The GUID of the first source topic.
+            label (str): The relationship label.
+        """
+        self.operations.append(MindmapOperation(RELATE, ref, source_guid, target_ref=target_ref, label=label))
+
+    def batches(self):
+        """
+        Yield the operations grouped into flushable batches in dependency order.
+
+        Yields:
+            tuple[tuple[str], list[MindmapOperation]]: The operation kinds of the phase and its operations.
+        """
+        for kinds in PHASES:
+            batch = [operation for operation in self.operations if operation.kind in kinds]
+            if batch:
+                yield kinds, batch
+
+    def counts(self) -> dict:
+        """
+        Count the recorded operations by kind.
+
+        Returns:
+            dict: Mapping of operation kind to count.
+        """
+        counts = {}
+        for operation in self.operations:
+            counts[operation.kind] = counts.get(operation.kind, 0) + 1
+        return counts
+
+    def to_list(self) -> list[dict]:
+        """
+        Return a JSON serializable representation of the log.
+
+        Returns:
+            list[dict]: The recorded operations in order.
+        """
+        return [operation.to_dict() for operation in self.operations]
+
+    def replay(self, mindm, map_icons=None, handles=None) -> dict:
+        """
+        Replay the log against a connector.
+
+        Args:
+            mindm: The connector (or Mindmanager facade) to write to.
+            map_icons (list[MindmapIcon], optional): The map icons passed to set_topic_from_mindmap_topic.
+            handles (dict, optional): Handles of already existing topics keyed by reference.
+
+        Returns:
+            dict: Mapping of reference to the GUID of the created topic.
+        """
+        return MindmapOperationExecutor(mindm, map_icons, handles).execute(self)
+
+
+class MindmapOperationExecutor:
+    def __init__(self, mindm, map_icons=None, handles=None):
+        self.mindm = mindm
+        self.map_icons = map_icons if map_icons is not None else []
+        self.handles = dict(handles) if handles else {}
+        self.guids = {}
+        self.failed = set()
+
+    def execute(self, log: MindmapOperationLog) -> dict:
+        """
+        Flush all operations of the log batch by batch.
+
+        Args:
+            log (MindmapOperationLog): The operations to execute.
+
+        Returns:
+            dict: Mapping of reference to the GUID of the created topic.
+        """
+        for _, batch in log.batches():
+            for operation in batch:
+                self.execute_operation(operation)
+        return dict(self.guids)
+
+    def execute_operation(self, operation: MindmapOperation) -> None:
+        """
+        Execute a single operation. Operations which depend on a failed topic are skipped.
+
+        Args:
+            operation (MindmapOperation): The operation to execute.
+        """
+        if operation.ref in self.failed or operation.parent_ref in self.failed or operation.target_ref in self.failed:
+            if operation.kind == CREATE_TOPIC:
+                self.failed.add(operation.ref)
+            return
+        try:
+            if operation.kind == CREATE_TOPIC:
+                self._create_topic(operation)
+            elif operation.kind == SET_PROPS:
+                topic, topic_guid = self.mindm.set_topic_from_mindmap_topic(self.handles[operation.ref], operation.mindmap_topic, self.map_icons)
+                if topic is not None:
+                    self.handles[operation.ref] = topic
+                if topic_guid:
+                    self.guids[operation.ref] = topic_guid
+            elif operation.kind == TAG:
+                self.mindm.add_tag_to_topic(topic=None, tag_text=operation.text, topic_guid=self._guid(operation.ref))
+            elif operation.kind == LINK:
+                self.mindm.add_topic_link(self._guid(operation.ref), self._guid(operation.target_ref), operation.label)
+            elif operation.kind == RELATE:
+                self.mindm.add_relationship(self._guid(operation.ref), self._guid(operation.target_ref), operation.label)
+        except Exception as e:
+            if operation.kind == CREATE_TOPIC:
+                self.failed.add(operation.ref)
+            print(f"Error in {operation.kind} operation for topic {operation.source_guid}: {e}")
+
+    def handles_by_source(self, log: MindmapOperationLog) -> dict:
+        """
+        Map the source GUIDs of the created topics to their connector handles.
+
+        Args:
+            log (MindmapOperationLog): The executed operations.
+
+        Returns:
+            dict: Mapping of source GUID to the list of handles created for it (more than one for duplicates).
+        """
+        handles = {}
+        for operation in log:
+            if operation.kind == CREATE_TOPIC and operation.ref in self.handles:
+                handles.setdefault(operation.source_guid, []).append(self.handles[operation.ref])
+        return handles
+
+    def _create_topic(self, operation: MindmapOperation) -> None:
+        if operation.parent_ref is None:
+            central_topic = self.mindm.get_central_topic()
+            topic = self.mindm.get_topic_by_id(central_topic.guid)
+            self.mindm.set_text_to_topic(topic, operation.text)
+            self.guids[operation.ref] = central_topic.guid
+        else:
+            topic = self.mindm.add_subtopic_to_topic(self.handles[operation.parent_ref], operation.text)
+            if topic is None:
+                raise ValueError("subtopic could not be created")
+        self.handles[operation.ref] = topic
+
+    def _guid(self, ref: int) -> str:
+        if ref not in self.guids:
+            self.guids[ref] = self.mindm.get_guid_from_topic(self.handles[ref])
+        return self.guids[ref]
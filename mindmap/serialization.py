@@ -102,113 +102,163 @@ def serialize_object_simple(obj, name='', visited=None, ignore_rtf=True):
         return serialized
     return str(obj)
 
-def serialize_mindmap(root_topic, guid_mapping, id_only=False):
-    """Serialize a mindmap to valid Mermaid format including id and all other attributes (optional).
+def iter_topics(root_topic):
+    """Iterate over a mindmap tree depth-first in document order.
     
     Args:
         root_topic (MindmapTopic): Root topic of the mindmap
+        
+    Yields:
+        tuple[int, MindmapTopic]: Level relative to the root topic and the topic
+    """
+    stack = [(0, root_topic)]
+    while stack:
+        level, topic = stack.pop()
+        yield level, topic
+        for sub in reversed(topic.subtopics):
+            stack.append((level + 1, sub))
+
+def _with_next_level(topics):
+    """Attach the level of the following topic to each (level, topic) pair, None for the last one."""
+    previous = None
+    for level, topic in topics:
+        if previous is not None:
+            yield previous[0], previous[1], level
+        previous = (level, topic)
+    if previous is not None:
+        yield previous[0], previous[1], None
+
+def _serialize_topic_attributes(topic, guid_mapping, ignore_rtf=True):
+    """Extract and serialize the attributes of a MindmapTopic.
+    
+    Args:
+        topic (MindmapTopic): The topic to serialize
         guid_mapping (dict): Dictionary mapping GUIDs to numeric IDs
-        id_only (bool, optional): If True, only include IDs without detailed attributes. Defaults to False.
         
     Returns:
-        str: Mermaid formatted string representing the mindmap
+        dict: Dictionary containing serialized topic attributes
     """
-    lines = ["mindmap"]
+    d = {}
+    d["id"] = guid_mapping.get(topic.guid, topic.guid)
+    #d["text"] = topic.text
+    if topic.rtf != topic.text and not ignore_rtf == True:
+        d["rtf"] = topic.rtf
+    if topic.selected == True:
+        d["selected"] = topic.selected
+    if topic.links:
+        d["links"] = []
+        for link in topic.links:
+            l = {}
+            if link.text:
+                l["text"] = link.text
+            if link.url:
+                l["url"] = link.url
+            if link.guid:
+                l["id"] = guid_mapping.get(link.guid, link.guid)
+            d["links"].append(l)
+    if topic.image:
+        d["image"] = {"text": topic.image.text}
+    if topic.icons:
+        d["icons"] = []
+        for icon in topic.icons:
+            i = {}
+            if icon.text:
+                i["text"] = icon.text
+            if icon.is_stock_icon is not None:
+                i["is_stock_icon"] = icon.is_stock_icon
+            if icon.index is not None:
+                i["index"] = icon.index
+            if icon.signature:
+                i["signature"] = icon.signature
+            if icon.path:
+                i["path"] = icon.path
+            if icon.group:
+                i["group"] = icon.group
+            d["icons"].append(i)
+    if topic.notes and (topic.notes.text or topic.notes.xhtml or topic.notes.rtf):
+        notes = {}
+        if topic.notes.text:
+            notes["text"] = topic.notes.text
+        if topic.notes.xhtml:
+            notes["xhtml"] = topic.notes.xhtml
+        if topic.notes.rtf:
+            notes["rtf"] = topic.notes.rtf
+        if notes != {}:
+            d["notes"] = notes
+    if topic.tags:
+        d["tags"] = [tag.text for tag in topic.tags]
+    if topic.references:
+        d["references"] = []
+        for ref in topic.references:
+            r = {}
+            if ref.guid_1:
+                r["id_1"] = guid_mapping.get(ref.guid_1, ref.guid_1)
+            if ref.guid_2:
+                r["id_2"] = guid_mapping.get(ref.guid_2, ref.guid_2)
+            if ref.direction:
+                r["direction"] = ref.direction
+            if ref.label:
+                r["label"] = ref.label
+            d["references"].append(r)
+    d = helpers.replace_unicode_in_obj(d)
+    return d
 
-    def serialize_topic_attributes(topic, guid_mapping, ignore_rtf=True):
-        """Extract and serialize the attributes of a MindmapTopic.
-        
-        Args:
-            topic (MindmapTopic): The topic to serialize
-            guid_mapping (dict): Dictionary mapping GUIDs to numeric IDs
-            
-        Returns:
-            dict: Dictionary containing serialized topic attributes
-        """
-        d = {}
-        d["id"] = guid_mapping.get(topic.guid, topic.guid)
-        #d["text"] = topic.text
-        if topic.rtf != topic.text and not ignore_rtf == True:
-            d["rtf"] = topic.rtf
-        if topic.selected == True:
-            d["selected"] = topic.selected
-        if topic.links:
-            d["links"] = []
-            for link in topic.links:
-                l = {}
-                if link.text:
-                    l["text"] = link.text
-                if link.url:
-                    l["url"] = link.url
-                if link.guid:
-                    l["id"] = guid_mapping.get(link.guid, link.guid)
-                d["links"].append(l)
-        if topic.image:
-            d["image"] = {"text": topic.image.text}
-        if topic.icons:
-            d["icons"] = []
-            for icon in topic.icons:
-                i = {}
-                if icon.text:
-                    i["text"] = icon.text
-                if icon.is_stock_icon is not None:
-                    i["is_stock_icon"] = icon.is_stock_icon
-                if icon.index is not None:
-                    i["index"] = icon.index
-                if icon.signature:
-                    i["signature"] = icon.signature
-                if icon.path:
-                    i["path"] = icon.path
-                if icon.group:
-                    i["group"] = icon.group
-                d["icons"].append(i)
-        if topic.notes and (topic.notes.text or topic.notes.xhtml or topic.notes.rtf):
-            notes = {}
-            if topic.notes.text:
-                notes["text"] = topic.notes.text
-            if topic.notes.xhtml:
-                notes["xhtml"] = topic.notes.xhtml
-            if topic.notes.rtf:
-                notes["rtf"] = topic.notes.rtf
-            if notes != {}:
-                d["notes"] = notes
-        if topic.tags:
-            d["tags"] = [tag.text for tag in topic.tags]
-        if topic.references:
-            d["references"] = []
-            for ref in topic.references:
-                r = {}
-                if ref.guid_1:
-                    r["id_1"] = guid_mapping.get(ref.guid_1, ref.guid_1)
-                if ref.guid_2:
-                    r["id_2"] = guid_mapping.get(ref.guid_2, ref.guid_2)
-                if ref.direction:
-                    r["direction"] = ref.direction
-                if ref.label:
-                    r["label"] = ref.label
-                d["references"].append(r)
-        d = helpers.replace_unicode_in_obj(d)
-        return d
+def iter_mindmap_lines(topics, guid_mapping, id_only=False):
+    """Serialize a stream of topics to Mermaid lines including id and all other attributes (optional).
     
-    def traverse(topic, indent):
-        indent_str = "  " * indent
+    Topics without an entry in guid_mapping get the next free id, so the mapping
+    can be built while the topics are produced.
+    
+    Args:
+        topics (iterable): (level, MindmapTopic) pairs in depth-first order
+        guid_mapping (dict): Dictionary mapping GUIDs to numeric IDs
+        id_only (bool, optional): If True, only include IDs without detailed attributes. Defaults to False.
+        
+    Yields:
+        str: Mermaid formatted lines
+    """
+    yield "mindmap"
+    for level, topic in topics:
+        if topic.guid not in guid_mapping:
+            guid_mapping[topic.guid] = len(guid_mapping) + 1
+        indent_str = "  " * (level + 1)
         node_text = helpers.escape_mermaid_text(topic.text)
         if id_only:
             id = guid_mapping.get(topic.guid, topic.guid)
             line = f"{indent_str}id{id}[{node_text}]"
-            #line = f"{indent_str}({node_text})"
-            #topic_attrs = {"id": id}
         else:
             line = f"{indent_str}[{node_text}]"
-            topic_attrs = serialize_topic_attributes(topic, guid_mapping, ignore_rtf=IGNORE_RTF)
+            topic_attrs = _serialize_topic_attributes(topic, guid_mapping, ignore_rtf=IGNORE_RTF)
             json_comment = json.dumps(topic_attrs, ensure_ascii=True)
             line += f" %% {json_comment}"
-        lines.append(line)
-        for sub in topic.subtopics:
-            traverse(sub, indent + 1)
+        yield line
 
-    traverse(root_topic, 1)
-    return "\n".join(lines)
+def serialize_mindmap(root_topic, guid_mapping, id_only=False):
+    """Serialize a mindmap to valid Mermaid format including id and all other attributes (optional).
+    
+    Args:
+        root_topic (MindmapTopic): Root topic of the mindmap
+        guid_mapping (dict): Dictionary mapping GUIDs to numeric IDs
+        id_only (bool, optional): If True, only include IDs without detailed attributes. Defaults to False.
+        
+    Returns:
+        str: Mermaid formatted string representing the mindmap
+    """
+    return "\n".join(iter_mindmap_lines(iter_topics(root_topic), guid_mapping, id_only))
+
+def iter_mindmap_simple_lines(topics):
+    """Serialize a stream of topics to simplified Mermaid lines with indentation-only nodes.
+    
+    Args:
+        topics (iterable): (level, MindmapTopic) pairs in depth-first order
+        
+    Yields:
+        str: Mermaid formatted lines (text and indentation only)
+    """
+    yield "mindmap"
+    for level, topic in topics:
+        text = topic.text if topic.text is not None else ""
+        yield f"{'  ' * (level + 1)}{text}"
 
 def serialize_mindmap_simple(root_topic: MindmapTopic) -> str:
     """Serialize a mindmap to a simplified Mermaid format with indentation-only nodes.
@@ -219,17 +269,75 @@ def serialize_mindmap_simple(root_topic: MindmapTopic) -> str:
     Returns:
         str: Mermaid formatted string (text and indentation only)
     """
-    lines = ["mindmap"]
+    return "\n".join(iter_mindmap_simple_lines(iter_topics(root_topic)))
 
-    def traverse(topic, indent):
-        indent_str = "  " * indent
-        text = topic.text if topic.text is not None else ""
-        lines.append(f"{indent_str}{text}")
-        for sub in topic.subtopics:
-            traverse(sub, indent + 1)
+def _notes_to_markdown(notes):
+    """Convert topic notes to the markdown content used by the markdown export.
+    
+    Args:
+        notes (MindmapNotes): Notes of a topic
+        
+    Returns:
+        str: Markdown content of the notes, empty if there are none
+    """
+    notes_text = ""
+    notes_xhtml = ""
+    notes_rtf = ""
+    if notes:
+        if notes.text or notes.xhtml or notes.rtf:
+            if notes.text:
+                notes_text = notes.text
+            if notes.xhtml:
+                xhtml = notes.xhtml
+                root_match = re.search(r'<(?:root|body)[^>]*>(.*?)</(?:root|body)>', xhtml, re.DOTALL | re.IGNORECASE)
+                if root_match:
+                    xhtml = root_match.group(1)
+                xhtml = re.sub(r'<\?xml[^>]*\?>', '', xhtml)
+                xhtml = re.sub(r'<!DOCTYPE[^>]*>', '', xhtml)
+                try:
+                    h = html2text.HTML2Text()
+                    h.ignore_links = False
+                    h.ignore_images = False
+                    h.body_width = 0  # Don't wrap lines
+                    notes_xhtml = h.handle(xhtml).strip()
+                except ImportError:
+                    notes_xhtml = re.sub(r'<[^>]*>', '', xhtml).strip()
+            if notes.rtf:
+                # not implemented due to bad results
+                pass
+    notes_content = notes_text
+    if notes_rtf:
+        notes_content = notes_rtf
+    if notes_xhtml:
+        notes_content = notes_xhtml
+    return notes_content
 
-    traverse(root_topic, 1)
-    return "\n".join(lines)
+def iter_mindmap_markdown_lines(topics, include_notes=True):
+    """Serialize a stream of topics to markdown lines including notes (optional).
+    
+    Args:
+        topics (iterable): (level, MindmapTopic) pairs in depth-first order
+        include_notes (bool, optional): If True, notes are included
+        
+    Yields:
+        str: Markdown formatted lines
+    """
+    counters = []
+    for level, topic, next_level in _with_next_level(topics):
+        del counters[level + 1:]
+        if len(counters) > level:
+            counters[level] += 1
+        else:
+            counters.append(1)
+        prefix = ".".join(str(index) for index in counters[1:level + 1])
+
+        notes_content = _notes_to_markdown(topic.notes) if include_notes else ""
+        if next_level is not None and next_level > level:
+            yield f"{(level + 1) * '#'} {prefix if level > 0 else ''} {topic.text}  "
+        else:
+            yield f"- {topic.text}  "
+        if notes_content:
+            yield f"Notes: {notes_content}  "
 
 def serialize_mindmap_markdown(root_topic, include_notes=True):
     """Serialize a mindmap to markdown including notes (optional).
@@ -241,73 +349,60 @@ def serialize_mindmap_markdown(root_topic, include_notes=True):
     Returns:
         str: Markdown formatted string representing the mindmap
     """
+    return "\n".join(iter_mindmap_markdown_lines(iter_topics(root_topic), include_notes))
 
-    lines = []
+def _serialize_topic_fields_simple(topic):
+    """Serialize the attributes of a single topic like serialize_object_simple, split around the subtopics.
     
-    def traverse(topic, lines, level, prefix, index):
-        text = topic.text
-        notes_text = ""
-        notes_xhtml = ""
-        notes_rtf = ""
-
-        if level > 0:
-            if prefix == '':
-                prefix = str(index)
-            else:
-                prefix = f"{prefix}.{index}"
+    Args:
+        topic (MindmapTopic): The topic to serialize
         
-        if topic.notes:
-            if topic.notes.text or topic.notes.xhtml or topic.notes.rtf:
-                if topic.notes.text:
-                    notes_text = topic.notes.text
-                if topic.notes.xhtml:
-                    xhtml = topic.notes.xhtml
-                    root_match = re.search(r'<(?:root|body)[^>]*>(.*?)</(?:root|body)>', xhtml, re.DOTALL | re.IGNORECASE)
-                    if root_match:
-                        xhtml = root_match.group(1)
-                    xhtml = re.sub(r'<\?xml[^>]*\?>', '', xhtml)
-                    xhtml = re.sub(r'<!DOCTYPE[^>]*>', '', xhtml)
-                    try:
-                        h = html2text.HTML2Text()
-                        h.ignore_links = False
-                        h.ignore_images = False
-                        h.body_width = 0  # Don't wrap lines
-                        notes_xhtml = h.handle(xhtml).strip()
-                    except ImportError:
-                        notes_xhtml = re.sub(r'<[^>]*>', '', xhtml).strip()
-                if topic.notes.rtf:
-                    # not implemented due to bad results
-                    pass
+    Returns:
+        tuple[list, list]: (name, value) pairs before and after the subtopics attribute
+    """
+    before = []
+    after = []
+    current = before
+    for attr_name, attr_value in vars(topic).items():
+        if attr_name == "subtopics":
+            current = after
+            continue
+        if attr_name in ["parent", "level", "selected", "rtf"]:
+            continue
+        if attr_value is None or attr_value == "" or attr_value == []:
+            continue
+        dict_val = serialize_object_simple(attr_value, attr_name)
+        if dict_val != {}:
+            current.append((attr_name, dict_val))
+    return before, after
 
-        if include_notes and (notes_text or notes_xhtml or notes_rtf):
-            notes_content = notes_text
-            if notes_rtf:
-                notes_content = notes_rtf
-            if notes_xhtml:
-                notes_content = notes_xhtml
-            notes = f"Notes: {notes_content}  "
-        else:
-            notes = ""
+def iter_mindmap_json_chunks(topics):
+    """Serialize a stream of topics to JSON chunks.
+    
+    The joined chunks are equal to ``json.dumps(serialize_object_simple(root_topic))``.
+    
+    Args:
+        topics (iterable): (level, MindmapTopic) pairs in depth-first order
         
-        if topic.subtopics:
-            line = f"{(level + 1) * '#'} {prefix if level > 0 else ''} {text}  "
-            lines.append(line)
-            if notes:
-                lines.append(notes)
-
-            sub_index = 0
-            for sub in topic.subtopics:
-                sub_index += 1
-                traverse(sub, lines, level + 1, prefix, sub_index)
-        else:
-            line = f"- {text}  "
-            lines.append(line)
-            if notes:
-                lines.append(notes)
-
-    traverse(root_topic, lines, 0, '', 0)
-    return "\n".join(lines)
+    Yields:
+        str: JSON text chunks
+    """
+    def fields(items):
+        return ", ".join(f"{json.dumps(name)}: {json.dumps(value)}" for name, value in items)
 
+    open_topics = []
+    for level, topic, next_level in _with_next_level(topics):
+        before, after = _serialize_topic_fields_simple(topic)
+        if next_level is not None and next_level > level:
+            yield "{" + fields(before) + (", " if before else "") + '"subtopics": ['
+            open_topics.append(after)
+            continue
+        yield "{" + fields(before + after) + "}"
+        while len(open_topics) > (next_level or 0):
+            after = open_topics.pop()
+            yield "]" + (", " if after else "") + fields(after) + "}"
+        if next_level is not None:
+            yield ", "
 
 def deserialize_mermaid_with_id(mermaid_text: str, guid_mapping: dict) -> MindmapTopic:
     """Convert Mermaid text with id to a Mindmap structure.
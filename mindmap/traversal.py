@@ -0,0 +1,73 @@
+"""
+Iterative depth-first traversal of topic trees.
+
+The generators keep an explicit stack instead of recursing, so the depth of
+a map is not limited by the recursion limit. Children are requested from the
+``children`` callable only when a node is expanded, i.e. after the node has
+been yielded by ``iter_preorder``; a consumer may therefore attach data to a
+node (or decide what its children are) before they are requested.
+"""
+
+
+def subtopics(topic):
+    """Return the subtopics of a MindmapTopic (default ``children`` callable)."""
+    return topic.subtopics
+
+
+def iter_preorder(root, children=subtopics, key=None):
+    """Iterate over a tree depth-first, parents before children, in document order.
+
+    Args:
+        root: The root node.
+        children (callable, optional): Returns the children of a node. Defaults to the subtopics of a MindmapTopic.
+        key (callable, optional): Returns an identity for a node. Nodes with an already seen key are skipped
+            together with their children.
+
+    Yields:
+        tuple[int, object, object]: Level relative to the root, the node and its parent (None for the root)
+    """
+    seen = set() if key is not None else None
+    stack = [(0, root, None)]
+    while stack:
+        level, node, parent = stack.pop()
+        if seen is not None:
+            node_key = key(node)
+            if node_key in seen:
+                continue
+            seen.add(node_key)
+        yield level, node, parent
+        nodes = list(children(node))
+        for i in range(len(nodes) - 1, -1, -1):
+            stack.append((level + 1, nodes[i], node))
+
+
+def iter_postorder(root, children=subtopics, key=None):
+    """Iterate over a tree depth-first, children before parents, in document order.
+
+    Children are requested when a node is entered, in the same order a recursive walk would enter them.
+
+    Args:
+        root: The root node.
+        children (callable, optional): Returns the children of a node. Defaults to the subtopics of a MindmapTopic.
+        key (callable, optional): Returns an identity for a node. Nodes with an already seen key are skipped
+            together with their children.
+
+    Yields:
+        tuple[int, object, object]: Level relative to the root, the node and its parent (None for the root)
+    """
+    seen = set() if key is not None else None
+    stack = [(0, root, None, False)]
+    while stack:
+        level, node, parent, expanded = stack.pop()
+        if expanded:
+            yield level, node, parent
+            continue
+        if seen is not None:
+            node_key = key(node)
+            if node_key in seen:
+                continue
+            seen.add(node_key)
+        stack.append((level, node, parent, True))
+        nodes = list(children(node))
+        for i in range(len(nodes) - 1, -1, -1):
+            stack.append((level + 1, nodes[i], node, False))
@@ -0,0 +1,37 @@
+import json
+
+import mindm.mindmanager_mac_as as mas
+
+
+def _connector() -> mas.Mindmanager:
+    return mas.Mindmanager.__new__(mas.Mindmanager)
+
+
+def test_get_mindmaptopics_reads_in_chunks(monkeypatch) -> None:
+    calls = []
+
+    def fake_run(path, args):
+        calls.append(args)
+        return json.dumps([
+            {"guid": topic_id, "text": topic_id.upper(), "level": 1, "notes": "n", "references": [{"guid_1": topic_id, "guid_2": "x", "direction": 1}]}
+            for topic_id in args[1:]
+        ])
+
+    monkeypatch.setattr(mas, "_run_compiled_applescript", fake_run)
+    monkeypatch.setattr(mas.Mindmanager, "LIST_PROPERTIES_CHUNK_SIZE", 2)
+    topics = _connector().get_mindmaptopics(["a", "b", "c", ""], mode="text")
+    assert calls == [["getListProperties", "a", "b"], ["getListProperties", "c"]]
+    assert [t.text for t in topics] == ["A", "B", "C"]
+    assert topics[0].notes is None and topics[0].references == []
+
+
+def test_get_parents_from_topics_parses_pairs(monkeypatch) -> None:
+    scripts = []
+
+    def fake_run(script, args=None):
+        scripts.append(script)
+        return "a||root\nroot||\n"
+
+    monkeypatch.setattr(mas, "_run_applescript", fake_run)
+    assert _connector().get_parents_from_topics(["a", "root"]) == {"a": "root", "root": ""}
+    assert len(scripts) == 1 and '{"a", "root"}' in scripts[0]
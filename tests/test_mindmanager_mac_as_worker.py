@@ -0,0 +1,88 @@
+import json
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+import mindm.mindmanager_mac_as as mas
+
+STUB_WORKER = textwrap.dedent(
+    """
+    import json
+    import os
+    import sys
+
+    sys.path.insert(0, {root!r})
+    from mindm.mindmanager_mac_as import read_frame, write_frame
+
+    loaded = []
+    while True:
+        request = read_frame(sys.stdin.buffer)
+        if request is None:
+            break
+        if request.get("script") == "exit":
+            sys.exit(1)
+        if request.get("script") == "fail":
+            write_frame(sys.stdout.buffer, {{"error": "stub failure"}})
+            continue
+        if "path" in request and request["path"] not in loaded:
+            loaded.append(request["path"])
+        write_frame(sys.stdout.buffer, {{"result": json.dumps({{"pid": os.getpid(), "request": request, "loaded": loaded}})}})
+    """
+)
+
+
+@pytest.fixture
+def worker(tmp_path: Path):
+    stub = tmp_path / "stub_worker.py"
+    stub.write_text(STUB_WORKER.format(root=str(Path(__file__).resolve().parents[1])))
+    worker = mas.AppleScriptWorker(command=[sys.executable, str(stub)])
+    yield worker
+    worker.close()
+
+
+def test_worker_reuses_process_and_keeps_scripts_loaded(worker) -> None:
+    first = json.loads(worker.run_compiled_script("/tmp/read.scpt", ["getTree", "Ä€"]))
+    second = json.loads(worker.run_compiled_script("/tmp/read.scpt", ["getSelection"]))
+    third = json.loads(worker.run_script('tell application "MindManager" to return version'))
+    assert first["request"] == {"path": "/tmp/read.scpt", "args": ["getTree", "Ä€"]}
+    assert first["pid"] == second["pid"] == third["pid"]
+    assert second["loaded"] == ["/tmp/read.scpt"]
+    assert third["request"] == {"script": 'tell application "MindManager" to return version'}
+
+
+def test_worker_reports_script_errors(worker) -> None:
+    with pytest.raises(RuntimeError, match="stub failure"):
+        worker.run_script("fail")
+    assert worker.is_running()
+
+
+def test_worker_restarts_after_crash(worker) -> None:
+    pid = json.loads(worker.run_script("ping"))["pid"]
+    with pytest.raises(EOFError):
+        worker.run_script("exit")
+    assert json.loads(worker.run_script("ping"))["pid"] != pid
+
+
+def test_run_functions_dispatch_to_worker(worker, monkeypatch) -> None:
+    monkeypatch.setattr(mas, "_worker", worker)
+    monkeypatch.setattr(mas, "USE_APPLESCRIPT_WORKER", True)
+    result = json.loads(mas._run_compiled_applescript(mas.APPLESCRIPT_READ, ["getTree"]))
+    assert result["request"] == {"path": mas.APPLESCRIPT_READ, "args": ["getTree"]}
+    assert mas._run_applescript("fail") == ""
+
+
+def test_missing_worker_falls_back(monkeypatch) -> None:
+    monkeypatch.setattr(mas, "_worker", mas.AppleScriptWorker(command=["/nonexistent/osascript-worker"]))
+    monkeypatch.setattr(mas, "USE_APPLESCRIPT_WORKER", True)
+    calls = []
+
+    def fake_run(command, **kwargs):
+        calls.append(command)
+        return type("Result", (), {"stdout": "24.1\n"})()
+
+    monkeypatch.setattr(mas.subprocess, "run", fake_run)
+    assert mas._run_applescript("return version") == "24.1"
+    assert calls == [["osascript", "-e", "return version"]]
+    assert mas._worker is None
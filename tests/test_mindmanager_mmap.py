@@ -0,0 +1,175 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import mindm.mindmanager as mgr
+import mindm.mindmanager_mmap as mmap
+import mindmap.mindmap as mm
+import mindmap.serialization as mms
+
+EXAMPLE_MMAP = Path(__file__).resolve().parents[1] / "examples" / "Test_DOM.mmap"
+
+
+def _document(mode: str = "full") -> mm.MindmapDocument:
+    document = mm.MindmapDocument(mmap_path=str(EXAMPLE_MMAP))
+    document.get_mindmap(mode=mode)
+    return document
+
+
+def _by_text(topic: mm.MindmapTopic, text: str) -> mm.MindmapTopic:
+    if topic.text == text:
+        return topic
+    for sub in topic.subtopics:
+        found = _by_text(sub, text)
+        if found is not None:
+            return found
+    return None
+
+
+def test_oid_guid_roundtrip() -> None:
+    guid = mmap.oid_to_guid("hxiSGRlPpUmuCL+U4b9ZCg==")
+    assert guid == "87189219-194F-A549-AE08-BF94E1BF590A"
+    assert mmap.guid_to_oid(guid) == "hxiSGRlPpUmuCL+U4b9ZCg=="
+
+
+def test_mindmanager_uses_mmap_platform() -> None:
+    mindmanager = mgr.Mindmanager(mmap_path=str(EXAMPLE_MMAP))
+    assert mindmanager.platform == "mmap"
+    assert mindmanager.document_exists() is True
+    assert mindmanager.get_version() == "23"
+
+
+def test_get_mindmap_builds_tree() -> None:
+    document = _document()
+    root = document.mindmap
+    assert root.text == "Test"
+    assert root.level == 0
+    assert [t.text for t in root.subtopics] == ["1", "4", "2", "3", "5", "6", "Main Topic"]
+    assert document.max_topic_level == 3
+    assert root.subtopics[0].subtopics[0].parent is root.subtopics[0]
+
+
+def test_get_mindmap_reads_attributes() -> None:
+    root = _document().mindmap
+    assert _by_text(root, "2").notes.text == "Notes for 2"
+    assert _by_text(root, "2").notes.xhtml.startswith('<html xmlns="http://www.w3.org/1999/xhtml">')
+    assert [(l.text, l.url) for l in _by_text(root, "1").links] == [("Microsoft", "https://www.microsoft.com")]
+    main_topic = _by_text(root, "Main Topic")
+    assert [t.text for t in main_topic.tags] == ["Tag1"]
+    assert [(i.text, i.is_stock_icon) for i in main_topic.icons] == [("ArrowUp", True)]
+    assert _by_text(root, "3").links[0].guid == main_topic.guid
+
+
+def test_get_mindmap_reads_relationships_and_custom_icons() -> None:
+    root = _document().mindmap
+    topic_1 = _by_text(root, "1")
+    topic_4 = _by_text(root, "4")
+    assert [(r.guid_1, r.guid_2, r.direction) for r in topic_1.references] == [(topic_1.guid, topic_4.guid, 1)]
+    assert [r.direction for r in topic_4.references] == [2]
+    icon = _by_text(root, "11").icons[0]
+    assert (icon.text, icon.group, icon.is_stock_icon) == ("Test", "Group Name", False)
+    assert Path(icon.path).read_bytes()
+    assert Path(topic_4.image.text).suffix == ".png"
+
+
+def test_get_mindmap_text_mode_skips_attributes() -> None:
+    root = _document(mode="text").mindmap
+    assert _by_text(root, "2").notes is None
+    assert _by_text(root, "Main Topic").tags == []
+
+
+def test_get_selection_from_file() -> None:
+    document = mm.MindmapDocument(mmap_path=str(EXAMPLE_MMAP))
+    selection = document.get_selection()
+    assert [t.text for t in selection] == ["Main Topic"]
+    assert selection[0].parent.text == "Test"
+
+
+def test_missing_file_raises(tmp_path: Path) -> None:
+    document = mm.MindmapDocument(mmap_path=str(tmp_path / "missing.mmap"))
+    with pytest.raises(Exception):
+        document.get_mindmap()
+
+
+@pytest.mark.parametrize("mode", ["text", "content", "full"])
+def test_iter_mmap_topics_matches_tree_order(mode: str) -> None:
+    root = _document(mode=mode).mindmap
+    expected = [(level, t.guid, t.text) for level, t in mms.iter_topics(root)]
+    streamed = [(level, t.guid, t.text) for level, t in mmap.iter_mmap_topics(str(EXAMPLE_MMAP), mode)]
+    assert streamed == expected
+
+
+def test_iter_mmap_topics_keeps_only_ancestors() -> None:
+    topics = dict((t.text, t) for _, t in mmap.iter_mmap_topics(str(EXAMPLE_MMAP)))
+    assert topics["111"].parent is topics["11"]
+    assert topics["11"].subtopics == []
+    assert [r.direction for r in topics["4"].references] == [2]
+    assert (topics["11"].icons[0].text, topics["11"].icons[0].group) == ("Test", "Group Name")
+    assert topics["4"].image.text.startswith(mmap.ARCHIVE_URI_PREFIX)
+
+
+def test_streamed_serialization_matches_tree() -> None:
+    root = _document(mode="content").mindmap
+    path = str(EXAMPLE_MMAP)
+    assert "\n".join(mms.iter_mindmap_markdown_lines(mmap.iter_mmap_topics(path, "content"))) == mms.serialize_mindmap_markdown(root)
+    assert "\n".join(mms.iter_mindmap_simple_lines(mmap.iter_mmap_topics(path, "text"))) == mms.serialize_mindmap_simple(root)
+    assert "".join(mms.iter_mindmap_json_chunks(mmap.iter_mmap_topics(path, "content"))) == json.dumps(mms.serialize_object_simple(root))
+
+
+def _create(tmp_path: Path, root: mm.MindmapTopic) -> mm.MindmapDocument:
+    path = str(tmp_path / "created.mmap")
+    document = mm.MindmapDocument(mmap_path=path)
+    document.mindmap = root
+    document.create_mindmap_and_finalize()
+    created = mm.MindmapDocument(mmap_path=path)
+    created.get_mindmap()
+    return created
+
+
+def test_create_mindmap_roundtrip(tmp_path: Path) -> None:
+    source = _document().mindmap
+    created = _create(tmp_path, source).mindmap
+    # create_mindmap sorts the subtopics of the source in place
+    assert mms.serialize_mindmap_markdown(created) == mms.serialize_mindmap_markdown(source)
+    assert _by_text(created, "2").notes.text == "Notes for 2"
+    assert [(l.text, l.url) for l in _by_text(created, "1").links] == [("Microsoft", "https://www.microsoft.com")]
+    main_topic = _by_text(created, "Main Topic")
+    assert [t.text for t in main_topic.tags] == ["Tag1"]
+    assert [i.text for i in main_topic.icons] == ["ArrowUp"]
+    assert _by_text(created, "3").links[0].guid == main_topic.guid
+    assert [r.direction for r in _by_text(created, "4").references] == [2]
+    icon = _by_text(created, "11").icons[0]
+    assert (icon.text, icon.group, icon.is_stock_icon) == ("Test", "Group Name", False)
+    assert Path(_by_text(created, "4").image.text).read_bytes()
+
+
+def test_create_mindmap_marks_duplicates(tmp_path: Path) -> None:
+    root = mms.deserialize_mermaid_simple("mindmap\n  Root\n    A\n      Shared\n    B")
+    shared = root.subtopics[0].subtopics[0]
+    root.subtopics[1].subtopics.append(shared)
+    created = _create(tmp_path, root).mindmap
+    copies = [t for _, t in mms.iter_topics(created) if t.text == "Shared"]
+    assert len(copies) == 2
+    assert all(mm.DUPLICATED_TAG in [tag.text for tag in t.tags] for t in copies)
+    assert copies[0].links[0].guid == copies[1].guid
+
+
+def test_create_mindmap_writes_deep_maps(tmp_path: Path) -> None:
+    root = mm.MindmapTopic(guid="root", text="Root")
+    topic = root
+    for i in range(2000):
+        sub = mm.MindmapTopic(guid=f"topic-{i}", text=f"Topic {i}", parent=topic)
+        topic.subtopics.append(sub)
+        topic = sub
+    path = tmp_path / "deep.mmap"
+    mindmanager = mmap.Mindmanager("auto", str(path))
+    mindmanager.add_document(0)
+    handle = mindmanager.get_central_topic()
+    for level, topic in mms.iter_topics(root):
+        if level > 0:
+            handle = mindmanager.add_subtopic_to_topic(handle, topic.text)
+    mindmanager.finalize(2001)
+    streamed = list(mmap.iter_mmap_topics(str(path), "text"))
+    assert len(streamed) == 2001
+    assert streamed[-1][1].text == "Topic 1999"
@@ -121,6 +121,7 @@ def test_get_selection_builds_selected_topics() -> None:
     root = DummyTopic("root", "Root", 0)
     child = DummyTopic("child", "Child", 1, parent=root)
     doc = _doc()
+    doc.macos_access = "appscript"
     doc.mindm = DummyMindm(selection=[root, child])
     selection = doc.get_selection()
     assert [t.guid for t in selection] == ["root", "child"]
@@ -212,6 +213,56 @@ def test_count_parent_and_child_occurrences_counts() -> None:
     assert counts[root.guid]["parent"] == 1
 
 
+def _shared_tree() -> MindmapTopic:
+    root = MindmapTopic(guid="root", text="Root", level=0)
+    a = MindmapTopic(guid="a", text="A", level=1, parent=root)
+    b = MindmapTopic(guid="b", text="B", level=1, parent=root)
+    shared = MindmapTopic(guid="s", text="Shared", level=2, parent=a)
+    unnamed = MindmapTopic(guid="", text="Unnamed", level=3, parent=shared)
+    shared.subtopics = [unnamed]
+    a.subtopics = [shared, MindmapTopic(guid="b", text="B again", level=2)]
+    b.subtopics = [shared]
+    root.subtopics = [a, b]
+    a.tags = [MindmapTag(text="x"), MindmapTag(text="y")]
+    b.tags = [MindmapTag(text="y"), MindmapTag(text="z")]
+    root.icons = [MindmapIcon(text="Type", is_stock_icon=False, signature="sig", group="Types")]
+    shared.icons = [MindmapIcon(text="Type", is_stock_icon=False, signature="sig", group="Types")]
+    shared.links = [MindmapLink(text="to b", guid="b")]
+    a.references = [MindmapReference(guid_1="a", guid_2="b", direction=1, label="rel")]
+    return root
+
+
+def test_analyze_mindmap_matches_separate_walks() -> None:
+    doc = _doc()
+    expected_root = _shared_tree()
+    counts: dict[str, dict[str, int]] = {}
+    parents: dict[str, str] = {}
+    tags: list[str] = []
+    map_icons: list[MindmapIcon] = []
+    refs: list[MindmapReference] = []
+    links: list[MindmapReference] = []
+    doc.count_parent_and_child_occurrences(expected_root, counts)
+    doc.get_parents_from_mindmap(expected_root, parents)
+    doc.get_tags_from_mindmap(expected_root, tags)
+    doc.get_map_icons_and_fix_refs_from_mindmap(expected_root, map_icons)
+    doc.get_relationships_from_mindmap(expected_root, refs)
+    doc.get_topic_links_from_mindmap(expected_root, links)
+
+    root = _shared_tree()
+    analysis = doc.analyze_mindmap(root)
+    unnamed_guid = root.subtopics[0].subtopics[0].subtopics[0].guid
+    expected_guid = expected_root.subtopics[0].subtopics[0].subtopics[0].guid
+    assert unnamed_guid != ""
+    rename = lambda guid: "unnamed" if guid in (unnamed_guid, expected_guid) else guid
+    assert {rename(k): v for k, v in analysis.guid_counts.items()} == {rename(k): v for k, v in counts.items()}
+    assert {rename(k): v for k, v in analysis.parents.items()} == {rename(k): v for k, v in parents.items()}
+    assert analysis.tags == tags == ["x", "y"]
+    assert [i.signature for i in analysis.map_icons] == [i.signature for i in map_icons] == ["sig"]
+    assert root.icons[0] is root.subtopics[0].subtopics[0].icons[0] is analysis.map_icons[0]
+    assert [(r.guid_1, r.guid_2, r.label) for r in analysis.relationships] == [(r.guid_1, r.guid_2, r.label) for r in refs]
+    assert [(r.guid_1, r.guid_2, r.label) for r in analysis.links] == [(r.guid_1, r.guid_2, r.label) for r in links]
+
+
 def test_get_topic_texts_from_selection_sets_state() -> None:
     doc = _doc()
     root = MindmapTopic(guid="r", text="Root", level=0, selected=True)
@@ -354,3 +405,83 @@ def test_create_mindmap_and_finalize_calls_both() -> None:
     doc.finalize = lambda: calls.__setitem__("finalize", calls["finalize"] + 1)
     doc.create_mindmap_and_finalize()
     assert calls == {"create": 1, "finalize": 1}
+
+
+def test_build_mindmap_from_topics_rebuilds_hierarchy() -> None:
+    doc = _doc()
+    root = MindmapTopic(guid="root", text="Root", level=0)
+    a = MindmapTopic(guid="a", text="A", level=1)
+    b = MindmapTopic(guid="b", text="B", level=1)
+    a1 = MindmapTopic(guid="a1", text="A1", level=2)
+    orphan = MindmapTopic(guid="x", text="X", level=2)
+    result = doc.build_mindmap_from_topics([(root, ""), (a, "root"), (a1, "a"), (b, "root"), (orphan, "missing")])
+    assert result is root
+    assert [t.text for t in root.subtopics] == ["A", "B"]
+    assert a.subtopics == [a1] and a1.parent is a
+
+
+def test_get_mindmap_uses_bulk_read_on_windows() -> None:
+    doc = _doc()
+    doc.macos_access = "appscript"
+    doc.mindm = DummyMindm(platform="win")
+    root = MindmapTopic(guid="root", text="Root", level=0)
+    child = MindmapTopic(guid="child", text="Child", level=1)
+    doc.mindm.get_mindmaptopics_from_document = lambda mode: [(root, ""), (child, "root")]
+    assert doc.get_mindmap() is True
+    assert doc.mindmap is root
+    assert doc.max_topic_level == 1
+
+
+def test_get_selection_batches_parent_reads_on_applescript() -> None:
+    doc = _doc()
+    doc.macos_access = "applescript"
+    doc.mindm = DummyMindm(selection=[
+        MindmapTopic(guid="a1", text="A1", level=2),
+        MindmapTopic(guid="a2", text="A2", level=2),
+    ])
+    parents = {"a1": "a", "a2": "a", "a": "root", "root": ""}
+    topics = {"a": MindmapTopic(guid="a", text="A", level=1), "root": MindmapTopic(guid="root", text="Root", level=0)}
+    batches = []
+
+    def get_parents_from_topics(topic_ids):
+        batches.append(("parents", list(topic_ids)))
+        return {topic_id: parents[topic_id] for topic_id in topic_ids}
+
+    def get_mindmaptopics(topic_ids, mode):
+        batches.append(("topics", list(topic_ids)))
+        return [topics[topic_id] for topic_id in topic_ids]
+
+    doc.mindm.get_parents_from_topics = get_parents_from_topics
+    doc.mindm.get_mindmaptopics = get_mindmaptopics
+    selection = doc.get_selection()
+    assert batches == [("parents", ["a1", "a2"]), ("topics", ["a"]), ("parents", ["a"]), ("topics", ["root"])]
+    assert [t.parent.text for t in selection] == ["A", "A"]
+    assert selection[0].parent is selection[1].parent
+    assert selection[0].parent.parent.text == "Root"
+    assert doc.selected_topic_texts == ["A1", "A2"]
+
+
+def test_topic_index_updates_incrementally() -> None:
+    doc = _doc()
+    doc.max_topic_level = 2
+    doc.mindmap = _tree()
+    doc.index_topics()
+    child = doc.get_topic_by_guid("child")
+    assert child.text == "Child"
+    assert doc.get_topic_by_guid("grand").parent is child
+
+    grand = doc.get_topic_by_guid("grand")
+    doc.move_topic(grand, doc.mindmap)
+    assert grand.parent is doc.mindmap and grand.level == 1
+    assert child.subtopics == []
+
+    new = MindmapTopic(guid="new", text="New", level=0)
+    new.subtopics = [MindmapTopic(guid="leaf", text="Leaf", level=1, parent=new)]
+    doc.add_topic(grand, new)
+    assert doc.get_topic_by_guid("leaf").level == 3
+    assert doc.max_topic_level == 3
+
+    doc.remove_topic(new)
+    assert doc.get_topic_by_guid("new") is None
+    assert doc.get_topic_by_guid("leaf") is None
+    assert doc.get_topic_by_guid("grand") is grand
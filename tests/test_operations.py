@@ -0,0 +1,112 @@
+import json
+
+from mindmap.mindmap import DUPLICATE_LABEL, DUPLICATED_TAG, MindmapDocument, MindmapReference, MindmapTopic
+from mindmap.operations import CREATE_TOPIC, LINK, RELATE, SET_PROPS, TAG, MindmapOperationLog
+
+
+class RecordingMindm:
+    platform = "win"
+
+    def __init__(self):
+        self.calls = []
+        self._count = 0
+
+    def get_central_topic(self):
+        return MindmapTopic(guid="central")
+
+    def get_topic_by_id(self, guid):
+        return guid
+
+    def set_text_to_topic(self, topic, text):
+        self.calls.append(("set_text", topic, text))
+
+    def add_subtopic_to_topic(self, topic, text):
+        self._count += 1
+        self.calls.append(("add_subtopic", topic, text))
+        return f"new-{self._count}"
+
+    def set_topic_from_mindmap_topic(self, topic, mindmap_topic, map_icons):
+        self.calls.append(("set_props", topic, mindmap_topic.text))
+        return topic, topic
+
+    def get_guid_from_topic(self, topic):
+        return topic
+
+    def add_tag_to_topic(self, topic=None, tag_text="", topic_guid=""):
+        self.calls.append(("tag", topic_guid, tag_text))
+
+    def add_topic_link(self, guid1, guid2, label=""):
+        self.calls.append(("link", guid1, guid2, label))
+
+    def add_relationship(self, guid1, guid2, label=""):
+        self.calls.append(("relate", guid1, guid2, label))
+
+
+def _doc(turbo_mode: bool = False) -> MindmapDocument:
+    doc = MindmapDocument.__new__(MindmapDocument)
+    doc.turbo_mode = turbo_mode
+    doc.mindm = RecordingMindm()
+    return doc
+
+
+def _mindmap() -> MindmapTopic:
+    root = MindmapTopic(guid="root", text="Root", level=0)
+    b = MindmapTopic(guid="b", text="B", level=1, parent=root)
+    a = MindmapTopic(guid="a", text="A", level=1, parent=root)
+    shared = MindmapTopic(guid="s", text="Shared", level=2, parent=a)
+    a.subtopics = [shared]
+    b.subtopics = [shared]
+    root.subtopics = [b, a]
+    root.references = [MindmapReference(guid_1="a", guid_2="b", direction=1, label="rel")]
+    a.references = list(root.references)
+    return root
+
+
+def test_plan_mindmap_records_operations_by_source_guid() -> None:
+    doc = _doc()
+    doc.mindmap = _mindmap()
+    doc.parents = {}
+    doc.guid_counts = {}
+    doc.count_parent_and_child_occurrences(doc.mindmap, doc.guid_counts)
+    doc.get_parents_from_mindmap(doc.mindmap, doc.parents)
+    log = doc.plan_mindmap([doc.mindmap.references[0]], [])
+    assert doc.mindm.calls == []
+    assert log.counts() == {CREATE_TOPIC: 5, SET_PROPS: 5, TAG: 2, LINK: 2, RELATE: 1}
+    assert [(o.kind, o.source_guid) for o in log][:4] == [(CREATE_TOPIC, "root"), (SET_PROPS, "root"), (CREATE_TOPIC, "a"), (SET_PROPS, "a")]
+    assert json.loads(json.dumps(log.to_list()))[2] == {
+        "op": CREATE_TOPIC, "ref": 1, "source_guid": "a", "parent_ref": 0, "target_ref": None, "text": "A", "label": "",
+    }
+
+
+def test_replay_flushes_tree_before_links_and_relationships() -> None:
+    doc = _doc()
+    doc.mindmap = _mindmap()
+    doc.max_topic_level = 0
+    doc.mindm.add_document = doc.mindm.create_map_icons = lambda *args: None
+    doc.mindm.create_tags = lambda *args: None
+    doc.create_mindmap()
+    kinds = [call[0] for call in doc.mindm.calls]
+    assert kinds.index("tag") > max(i for i, kind in enumerate(kinds) if kind == "set_props")
+    assert ("relate", "new-1", "new-3", "rel") in doc.mindm.calls
+    assert ("tag", "new-2", DUPLICATED_TAG) in doc.mindm.calls
+    assert ("link", "new-4", "new-2", DUPLICATE_LABEL) in doc.mindm.calls
+    assert doc.created_handles["s"] == ["new-2", "new-4"]
+    assert doc.created_handles["root"] == ["central"]
+
+    # the log can be replayed against another connector
+    other = RecordingMindm()
+    doc.operations.replay(other)
+    assert other.calls == doc.mindm.calls
+
+
+def test_replay_skips_operations_of_failed_topics() -> None:
+    log = MindmapOperationLog()
+    root = log.create_topic("root", None, "Root")
+    child = log.create_topic("child", root, "Child")
+    grandchild = log.create_topic("grandchild", child, "Grandchild")
+    log.tag(grandchild, "grandchild", "Tag")
+    mindm = RecordingMindm()
+    mindm.add_subtopic_to_topic = lambda topic, text: None
+    guids = log.replay(mindm)
+    assert guids == {root: "central"}
+    assert [call[0] for call in mindm.calls] == ["set_text"]
@@ -122,3 +122,12 @@ def test_deserialize_mermaid_simple_parses_comments_and_brackets() -> None:
     root = mms.deserialize_mermaid_simple(mermaid)
     assert root.text == "Root"
     assert [t.text for t in root.subtopics] == ["Child", "Sibling"]
+
+
+def test_iter_mindmap_json_chunks_matches_serialize_object_simple() -> None:
+    root = _build_sample_tree()
+    grandchild = MindmapTopic(guid="grandchild-guid", text="Grandchild", parent=root.subtopics[0])
+    root.subtopics[0].subtopics.append(grandchild)
+    root.subtopics.append(MindmapTopic(guid="sibling-guid", text="Sibling", parent=root))
+    chunks = "".join(mms.iter_mindmap_json_chunks(mms.iter_topics(root)))
+    assert chunks == json.dumps(mms.serialize_object_simple(root))